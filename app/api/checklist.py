@@ -19,6 +19,7 @@ from app.config import get_settings
 from app.database import async_session_factory
 from app.models.project import Project
 from app.schemas.checklist import ChecklistResponse, RequirementsChecklist
+from app.services.errors import ExtractionInProgressError
 
 
 class ChecklistItemUpdate(BaseModel):
@@ -37,8 +38,8 @@ _checklist_service = None
 def _get_checklist_service():
     """Get or create the ChecklistService singleton.
 
-    Lazily initializes all required services (embedding, search, LLM,
-    citation verifier) on first call. Validates Gemini API key is set.
+    Lazily builds the service on first call from the shared search, LLM
+    and citation verifier singletons. Validates Gemini API key is set.
 
     Returns:
         The ChecklistService singleton instance.
@@ -55,30 +56,18 @@ def _get_checklist_service():
                 detail="BIDOPS_GEMINI_API_KEY not configured. Set it in .env or environment.",
             )
         from app.services.extraction.checklist_service import ChecklistService
-        from app.services.extraction.citation_verifier import CitationVerifier
-        from app.services.indexing.embedding_service import EmbeddingService
-        from app.services.llm.gemini_service import GeminiService
-        from app.services.search.hybrid_search import HybridSearchService
-
-        embedding_svc = EmbeddingService(
-            persist_dir=settings.chroma_persist_dir,
-            model_name=settings.embedding_model,
-        )
-        search_svc = HybridSearchService(embedding_service=embedding_svc)
-        llm_svc = GeminiService(
-            api_key=settings.gemini_api_key,
-            model=settings.gemini_model,
-        )
-        verifier = CitationVerifier(
-            model_name=settings.nli_model,
-            confidence_high=settings.confidence_high_threshold,
-            confidence_low=settings.confidence_low_threshold,
-            review_threshold=settings.review_threshold,
+        from app.services.shared import (
+            get_citation_verifier,
+            get_llm_service,
+            get_search_service,
         )
+
         _checklist_service = ChecklistService(
-            search_service=search_svc,
-            llm_service=llm_svc,
-            citation_verifier=verifier,
+            search_service=get_search_service(),
+            llm_service=get_llm_service(),
+            citation_verifier=get_citation_verifier(),
+            max_concurrency=settings.llm_max_concurrency,
+            max_consecutive_failures=settings.llm_max_consecutive_failures,
         )
     return _checklist_service
 
@@ -157,6 +146,12 @@ async def extract_project_checklist(project_id: int) -> ChecklistResponse:
             total_requirements=total_requirements,
             requirements_requiring_review=requirements_requiring_review,
         )
+    except ExtractionInProgressError as exc:
+        # Another request claimed the run after the check above.
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Checklist extraction already in progress for this project",
+        ) from exc
     except Exception as exc:
         logger.exception("Checklist extraction failed for project %d", project_id)
         raise HTTPException(
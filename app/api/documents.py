@@ -16,12 +16,13 @@ from pathlib import Path
 from typing import AsyncGenerator
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
-from sqlalchemy import select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sse_starlette.sse import EventSourceResponse
 
 from app.config import get_settings
 from app.database import get_db
+from app.models import DOCUMENT_LISTING_OPTIONS
 from app.models.base import DocumentStatus, ProjectStatus
 from app.models.document import Document
 from app.models.project import Project
@@ -35,6 +36,51 @@ router = APIRouter(tags=["documents"])
 
 ALLOWED_EXTENSIONS = {".pdf", ".docx", ".xlsx", ".xls"}
 
+# Maximum number of uploaded files written to disk at the same time.
+_MAX_CONCURRENT_WRITES = 8
+
+# Copy buffer for streaming uploads to disk (default is 64 KiB).
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+# SSE progress polling: start fast, back off while nothing changes.
+_PROGRESS_POLL_MIN_S = 0.25
+_PROGRESS_POLL_MAX_S = 2.0
+
+
+def _write_upload(file: UploadFile, dest_path: Path) -> int:
+    """Stream an uploaded file to disk and return its size in bytes.
+
+    Args:
+        file: Uploaded file whose spooled body is copied.
+        dest_path: Destination path on disk.
+
+    Returns:
+        Size of the written file in bytes.
+    """
+    # Stream file to disk (NOT await file.read() which loads into memory).
+    with open(dest_path, "wb") as dest_file:
+        shutil.copyfileobj(file.file, dest_file, length=_COPY_BUFFER_SIZE)
+    return dest_path.stat().st_size
+
+
+async def _save_upload(
+    file: UploadFile,
+    dest_path: Path,
+    semaphore: asyncio.Semaphore,
+) -> int:
+    """Write an uploaded file to disk on a worker thread.
+
+    Args:
+        file: Uploaded file to save.
+        dest_path: Destination path on disk.
+        semaphore: Bounds how many files are written concurrently.
+
+    Returns:
+        Size of the written file in bytes.
+    """
+    async with semaphore:
+        return await asyncio.to_thread(_write_upload, file, dest_path)
+
 
 @router.post(
     "/projects/{project_id}/upload",
@@ -78,6 +124,7 @@ async def upload_documents(
     uploaded_names: list[str] = []
     skipped_count = 0
     file_records: list[dict] = []
+    accepted: list[tuple[UploadFile, Path, str]] = []
 
     for file in files:
         if not file.filename:
@@ -93,16 +140,19 @@ async def upload_documents(
 
         # Generate safe filename to avoid collisions and path traversal.
         safe_name = f"{uuid.uuid4().hex}_{file.filename}"
-        dest_path = upload_dir / safe_name
-
-        # Stream file to disk (NOT await file.read() which loads into memory).
-        with open(dest_path, "wb") as dest_file:
-            shutil.copyfileobj(file.file, dest_file)
-
-        file_size = dest_path.stat().st_size
-
-        # Create Document record in database.
-        doc = Document(
+        accepted.append((file, upload_dir / safe_name, ext))
+
+    # Write files to disk concurrently off the event loop so large batches
+    # overlap their IO instead of blocking the server one file at a time.
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_WRITES)
+    file_sizes = await asyncio.gather(*(
+        _save_upload(file, dest_path, semaphore)
+        for file, dest_path, _ in accepted
+    ))
+
+    # Create Document records in database.
+    docs = [
+        Document(
             project_id=project_id,
             filename=file.filename,
             file_path=str(dest_path.as_posix()),
@@ -110,9 +160,12 @@ async def upload_documents(
             file_size=file_size,
             status=DocumentStatus.PENDING.value,
         )
-        db.add(doc)
-        await db.flush()  # Get the doc.id assigned.
+        for (file, dest_path, ext), file_size in zip(accepted, file_sizes)
+    ]
+    db.add_all(docs)
+    await db.flush()  # One INSERT batch; assigns every doc.id.
 
+    for doc, (file, dest_path, ext) in zip(docs, accepted):
         file_records.append({
             "doc_id": doc.id,
             "filename": file.filename,
@@ -127,9 +180,17 @@ async def upload_documents(
             detail="No supported files uploaded. Allowed: PDF, DOCX, XLSX.",
         )
 
-    # Update project counters and status.
-    project.total_documents = (project.total_documents or 0) + len(file_records)
-    project.status = ProjectStatus.INGESTING.value
+    # Update project counters and status. Incremented in SQL so concurrent
+    # uploads to the same project do not lose each other's counts.
+    await db.execute(
+        update(Project)
+        .where(Project.id == project_id)
+        .values(
+            total_documents=func.coalesce(Project.total_documents, 0)
+            + len(file_records),
+            status=ProjectStatus.INGESTING.value,
+        )
+    )
 
     await db.commit()
 
@@ -187,6 +248,7 @@ async def list_documents(
         select(Document)
         .where(Document.project_id == project_id)
         .order_by(Document.created_at)
+        .options(*DOCUMENT_LISTING_OPTIONS)
     )
     documents = result.scalars().all()
     return documents
@@ -196,9 +258,11 @@ async def list_documents(
 async def stream_progress(task_id: str):
     """Stream real-time processing progress via Server-Sent Events.
 
-    Polls the in-memory progress store every 0.5 seconds and yields
-    JSON-serialized progress data. The stream ends when the task reaches
-    "completed", "failed", or "unknown" status.
+    Polls the in-memory progress store and yields JSON-serialized
+    progress data whenever it has changed since the last event. The poll
+    interval starts at 0.25 seconds and backs off to 2 seconds while the
+    progress is unchanged, resetting as soon as it changes. The stream
+    ends when the task reaches "completed", "failed", or "unknown" status.
 
     Args:
         task_id: The task ID returned from the upload endpoint.
@@ -209,6 +273,8 @@ async def stream_progress(task_id: str):
 
     async def event_generator() -> AsyncGenerator[dict, None]:
         """Generate SSE events from the progress store."""
+        last_version: int | None = None
+        delay = _PROGRESS_POLL_MIN_S
         while True:
             progress = get_progress(task_id)
 
@@ -225,6 +291,15 @@ async def stream_progress(task_id: str):
                 }
                 break
 
+            # Only serialize and send when something changed.
+            version = progress.get("version")
+            if version == last_version:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _PROGRESS_POLL_MAX_S)
+                continue
+            last_version = version
+            delay = _PROGRESS_POLL_MIN_S
+
             yield {
                 "event": "progress",
                 "data": json.dumps({
@@ -240,6 +315,6 @@ async def stream_progress(task_id: str):
             if progress["status"] in ("completed", "failed"):
                 break
 
-            await asyncio.sleep(0.5)
+            await asyncio.sleep(delay)
 
     return EventSourceResponse(event_generator())
@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.main import templates
+from app.models import DOCUMENT_LISTING_OPTIONS, PROJECT_LISTING_OPTIONS
 from app.models.document import Document
 from app.models.project import Project
 
@@ -32,7 +33,9 @@ async def index_page(
         TemplateResponse rendering index.html with projects data.
     """
     result = await db.execute(
-        select(Project).order_by(Project.created_at.desc())
+        select(Project)
+        .order_by(Project.created_at.desc())
+        .options(*PROJECT_LISTING_OPTIONS)
     )
     projects = result.scalars().all()
     return templates.TemplateResponse(
@@ -71,6 +74,7 @@ async def project_page(
         select(Document)
         .where(Document.project_id == project_id)
         .order_by(Document.created_at)
+        .options(*DOCUMENT_LISTING_OPTIONS)
     )
     documents = result.scalars().all()
 
@@ -1,10 +1,12 @@
 """Project CRUD API endpoints."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.models import PROJECT_LISTING_OPTIONS
+from app.models.document import Document
 from app.models.project import Project
 from app.schemas.project import ProjectCreate, ProjectResponse
 
@@ -37,7 +39,9 @@ async def list_projects(
 ):
     """List all projects, ordered by creation date descending."""
     result = await db.execute(
-        select(Project).order_by(Project.created_at.desc())
+        select(Project)
+        .order_by(Project.created_at.desc())
+        .options(*PROJECT_LISTING_OPTIONS)
     )
     projects = result.scalars().all()
     return projects
@@ -67,11 +71,14 @@ async def delete_project(
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a project and all its documents."""
-    project = await db.get(Project, project_id)
-    if project is None:
+    # Bulk DELETEs instead of the ORM cascade, which would load every
+    # Document (including its extracted text) just to delete it row by row.
+    await db.execute(delete(Document).where(Document.project_id == project_id))
+    result = await db.execute(delete(Project).where(Project.id == project_id))
+    if result.rowcount == 0:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Project with id {project_id} not found",
         )
-    await db.delete(project)
     await db.commit()
@@ -11,16 +11,16 @@ Routes:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import get_settings
 from app.database import get_db
 from app.models.project import Project
 from app.schemas.search import SearchResponse, SearchResultItem
-from app.services.search.hybrid_search import HybridSearchService
+from app.services.shared import get_search_service
 
 logger = logging.getLogger(__name__)
 
@@ -29,31 +29,6 @@ router = APIRouter(
     tags=["search"],
 )
 
-# Lazy singleton for the search service (same pattern as document_service).
-_search_service: HybridSearchService | None = None
-
-
-def _get_search_service() -> HybridSearchService:
-    """Get or create the HybridSearchService singleton.
-
-    Lazily initializes the EmbeddingService and HybridSearchService
-    on first call to avoid startup cost when search is not used.
-
-    Returns:
-        The HybridSearchService singleton instance.
-    """
-    global _search_service
-    if _search_service is None:
-        settings = get_settings()
-        from app.services.indexing.embedding_service import EmbeddingService
-
-        embedding_svc = EmbeddingService(
-            persist_dir=settings.chroma_persist_dir,
-            model_name=settings.embedding_model,
-        )
-        _search_service = HybridSearchService(embedding_service=embedding_svc)
-    return _search_service
-
 
 @router.get("", response_model=SearchResponse)
 async def search_documents(
@@ -111,10 +86,13 @@ async def search_documents(
             detail=f"Project with id {project_id} not found",
         )
 
-    search_service = _get_search_service()
+    search_service = get_search_service()
 
     try:
-        search_results = search_service.search(
+        # Embedding, ANN lookup and BM25 scoring are blocking; keep them
+        # off the event loop.
+        search_results = await asyncio.to_thread(
+            search_service.search,
             project_id=project_id,
             query=q,
             top_k=limit,
@@ -16,6 +16,7 @@ class Settings(BaseSettings):
     # ChromaDB vector storage (Phase 2)
     chroma_persist_dir: str = "data/chroma"
     embedding_model: str = "paraphrase-multilingual-mpnet-base-v2"
+    query_embedding_cache_size: int = 512
 
     # Chunking parameters (Phase 2)
     chunk_max_chars: int = 400
@@ -24,6 +25,10 @@ class Settings(BaseSettings):
     # LLM settings (Phase 3)
     gemini_api_key: str = ""
     gemini_model: str = "gemini-2.5-pro"
+    # Maximum concurrent LLM extraction calls per extraction/checklist run.
+    llm_max_concurrency: int = 4
+    # Consecutive LLM failures after which a run stops calling the LLM.
+    llm_max_consecutive_failures: int = 5
 
     # NLI citation verification (Phase 3)
     nli_model: str = "cross-encoder/nli-deberta-v3-xsmall"
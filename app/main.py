@@ -1,7 +1,10 @@
 """FastAPI application entry point with lifespan management."""
 
+import atexit
 import logging
+import queue
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -20,7 +23,14 @@ from app.config import get_settings
 from app.database import engine
 from app.models import Base
 
-logging.basicConfig(level=logging.INFO)
+# Log records are queued by the calling code and written to stderr by a
+# listener thread, so slow log I/O never blocks the event loop. The listener
+# runs for the whole process (not just the lifespan) and is flushed at exit.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
 logger = logging.getLogger(__name__)
 
 # Jinja2 template engine (accessible from pages.py via import)
@@ -1,13 +1,30 @@
 """SQLAlchemy models for BidOps AI."""
 
+from sqlalchemy.orm import defer
+
 from app.models.base import Base, DocumentStatus, ProjectStatus
 from app.models.document import Document
 from app.models.project import Project
 
+# Loader options for listing queries, which never read the large text
+# columns. Add new large columns here. Defined once both models exist,
+# because building the options configures the mappers.
+DOCUMENT_LISTING_OPTIONS = (
+    defer(Document.extracted_text),
+    defer(Document.tables_json),
+    defer(Document.metadata_json),
+)
+PROJECT_LISTING_OPTIONS = (
+    defer(Project.summary_json),
+    defer(Project.checklist_json),
+)
+
 __all__ = [
     "Base",
+    "DOCUMENT_LISTING_OPTIONS",
     "Document",
     "DocumentStatus",
+    "PROJECT_LISTING_OPTIONS",
     "Project",
     "ProjectStatus",
 ]
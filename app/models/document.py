@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, DocumentStatus
@@ -18,6 +18,11 @@ class Document(Base):
     """A document uploaded to a project for parsing."""
 
     __tablename__ = "documents"
+    __table_args__ = (
+        # Backs the per-project document listing (filter + ORDER BY created_at)
+        # and the bulk delete by project_id.
+        Index("ix_documents_project_created", "project_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"), nullable=False)
@@ -17,7 +17,8 @@ import asyncio
 import json
 import logging
 
-from sqlalchemy import select
+from sqlalchemy import func, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
 from app.database import async_session_factory
@@ -25,7 +26,6 @@ from app.models.base import DocumentStatus, ProjectStatus
 from app.models.document import Document
 from app.models.project import Project
 from app.services.indexing.chunking_service import ChunkingService
-from app.services.indexing.embedding_service import EmbeddingService
 from app.services.parsing.base import get_parser_for_file
 from app.services.progress import (
     add_error,
@@ -35,12 +35,13 @@ from app.services.progress import (
     init_progress,
     update_progress,
 )
+from app.services.shared import get_embedding_service, get_search_service
 
 logger = logging.getLogger(__name__)
 
-# Lazy-initialized indexing services (same pattern as PdfParser's lazy converter).
+# Lazy-initialized chunking service (same pattern as PdfParser's lazy converter).
+# The embedding and search services are the shared app.services.shared ones.
 _chunking_service = None
-_embedding_service = None
 
 
 def _get_chunking_service() -> ChunkingService:
@@ -55,16 +56,26 @@ def _get_chunking_service() -> ChunkingService:
     return _chunking_service
 
 
-def _get_embedding_service() -> EmbeddingService:
-    """Get or create the embedding service singleton."""
-    global _embedding_service
-    if _embedding_service is None:
-        settings = get_settings()
-        _embedding_service = EmbeddingService(
-            persist_dir=settings.chroma_persist_dir,
-            model_name=settings.embedding_model,
-        )
-    return _embedding_service
+async def _increment_project_counter(
+    db: AsyncSession, project_id: int, counter: str
+) -> None:
+    """Atomically increment one of a project's document counters.
+
+    Issues a single ``UPDATE ... SET counter = counter + 1`` instead of
+    loading the Project row and writing back a Python-side sum, so two
+    batches for the same project cannot overwrite each other's counts.
+
+    Args:
+        db: Open database session (caller commits).
+        project_id: Database ID of the project.
+        counter: Counter column name, e.g. "processed_documents".
+    """
+    column = getattr(Project, counter)
+    await db.execute(
+        update(Project)
+        .where(Project.id == project_id)
+        .values({column: func.coalesce(column, 0) + 1})
+    )
 
 
 async def process_documents_batch(
@@ -129,11 +140,9 @@ async def process_documents_batch(
                         doc.processing_time_ms = parsed.processing_time_ms
 
                         # Update project failure count.
-                        project = await db.get(Project, project_id)
-                        if project:
-                            project.failed_documents = (
-                                project.failed_documents or 0
-                            ) + 1
+                        await _increment_project_counter(
+                            db, project_id, "failed_documents"
+                        )
 
                         await db.commit()
                         add_error(task_id, filename, doc.error_message)
@@ -151,11 +160,9 @@ async def process_documents_batch(
                         doc.processing_time_ms = parsed.processing_time_ms
 
                         # Update project success count.
-                        project = await db.get(Project, project_id)
-                        if project:
-                            project.processed_documents = (
-                                project.processed_documents or 0
-                            ) + 1
+                        await _increment_project_counter(
+                            db, project_id, "processed_documents"
+                        )
 
                         await db.commit()
                         add_result(task_id, filename, "completed", parsed.page_count)
@@ -165,15 +172,19 @@ async def process_documents_batch(
                         # fail the document parse -- search is secondary.
                         try:
                             chunking_svc = _get_chunking_service()
-                            embedding_svc = _get_embedding_service()
+                            embedding_svc = get_embedding_service()
 
                             # Delete any existing chunks (re-upload case).
-                            embedding_svc.delete_document_chunks(
-                                project_id, doc_id
+                            await asyncio.to_thread(
+                                embedding_svc.delete_document_chunks,
+                                project_id,
+                                doc_id,
                             )
 
-                            # Chunk the parsed document.
-                            chunks = chunking_svc.chunk_document(
+                            # Chunk the parsed document (language detection
+                            # per chunk is CPU-bound -- run in thread pool).
+                            chunks = await asyncio.to_thread(
+                                chunking_svc.chunk_document,
                                 document_id=doc_id,
                                 pages=parsed.pages,
                                 filename=filename,
@@ -194,6 +205,12 @@ async def process_documents_batch(
                                     doc_id,
                                 )
 
+                            # The project's chunks changed; drop its cached
+                            # BM25 index so keyword search rebuilds it.
+                            get_search_service().invalidate_keyword_index(
+                                project_id
+                            )
+
                             # Enrich metadata with chunk info.
                             existing_meta = (
                                 json.loads(doc.metadata_json)
@@ -242,11 +259,9 @@ async def process_documents_batch(
                             doc.status = DocumentStatus.FAILED.value
                             doc.error_message = str(exc)
 
-                            project = await db.get(Project, project_id)
-                            if project:
-                                project.failed_documents = (
-                                    project.failed_documents or 0
-                                ) + 1
+                            await _increment_project_counter(
+                                db, project_id, "failed_documents"
+                            )
 
                             await db.commit()
                 except Exception as db_exc:
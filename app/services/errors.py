@@ -0,0 +1,9 @@
+"""Service-layer exceptions shared with the API layer.
+
+Kept free of heavy imports so API modules can import them at module level
+without loading the extraction services (and their ML models).
+"""
+
+
+class ExtractionInProgressError(Exception):
+    """Raised when an extraction run is already in progress for a project."""
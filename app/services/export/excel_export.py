@@ -3,12 +3,20 @@
 Generates an .xlsx workbook with two sheets:
 - Project Summary: All 13 extracted fields with confidence and citations.
 - Requirements Checklist: All checklist items grouped by category.
+
+Key design decisions:
+- The workbook is opened in write-only mode so rows are streamed to the
+  file instead of held as a full cell model; rows are collected first so
+  column widths can be fitted before any row is written.
 """
 
+import asyncio
 from io import BytesIO
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Alignment, Font, PatternFill
+from openpyxl.utils import get_column_letter
 from sqlalchemy import select
 
 from app.database import async_session_factory
@@ -39,28 +47,41 @@ HEADER_FILL = PatternFill(start_color="1a1a2e", end_color="1a1a2e", fill_type="s
 HEADER_ALIGNMENT = Alignment(horizontal="left", vertical="center")
 
 
-def _auto_fit_columns(ws) -> None:
-    """Auto-fit column widths based on cell content length."""
-    for col in ws.columns:
-        max_length = 0
-        col_letter = col[0].column_letter
-        for cell in col:
-            try:
-                cell_len = len(str(cell.value)) if cell.value else 0
-                if cell_len > max_length:
-                    max_length = cell_len
-            except (TypeError, AttributeError):
-                pass
-        ws.column_dimensions[col_letter].width = min(max_length + 2, 50)
-
-
-def _style_header_row(ws, headers: list[str]) -> None:
-    """Write and style a header row."""
-    ws.append(headers)
-    for cell in ws[1]:
+def _fit_column_widths(ws, headers: list[str], rows: list[list]) -> None:
+    """Set column widths based on the longest value in each column.
+
+    Write-only sheets cannot be read back, so widths are computed from the
+    rows before they are written.
+    """
+    widths = [len(str(value)) if value else 0 for value in headers]
+    for row in rows:
+        for idx, value in enumerate(row):
+            cell_len = len(str(value)) if value else 0
+            if cell_len > widths[idx]:
+                widths[idx] = cell_len
+    for idx, width in enumerate(widths, start=1):
+        ws.column_dimensions[get_column_letter(idx)].width = min(width + 2, 50)
+
+
+def _styled_header_row(ws, headers: list[str]) -> list[WriteOnlyCell]:
+    """Build a styled header row for a write-only sheet."""
+    cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
         cell.font = HEADER_FONT
         cell.fill = HEADER_FILL
         cell.alignment = HEADER_ALIGNMENT
+        cells.append(cell)
+    return cells
+
+
+def _write_sheet(wb: Workbook, title: str, headers: list[str], rows: list[list]) -> None:
+    """Create a sheet with a styled header row followed by the given rows."""
+    ws = wb.create_sheet(title)
+    _fit_column_widths(ws, headers, rows)
+    ws.append(_styled_header_row(ws, headers))
+    for row in rows:
+        ws.append(row)
 
 
 async def generate_excel_report(project_id: int) -> BytesIO:
@@ -77,31 +98,47 @@ async def generate_excel_report(project_id: int) -> BytesIO:
     """
     async with async_session_factory() as session:
         result = await session.execute(
-            select(Project).where(Project.id == project_id)
+            select(Project.summary_json, Project.checklist_json)
+            .where(Project.id == project_id)
         )
-        project = result.scalar_one_or_none()
-        if project is None:
+        row = result.one_or_none()
+        if row is None:
             raise ValueError(f"Project with id {project_id} not found")
 
-    wb = Workbook()
+    return await asyncio.to_thread(
+        _build_excel_report, row.summary_json, row.checklist_json
+    )
 
-    # ── Summary Sheet ───────────────────────────────────────────
-    ws_summary = wb.active
-    ws_summary.title = "Project Summary"
 
-    _style_header_row(ws_summary, [
+def _build_excel_report(
+    summary_json: str | None, checklist_json: str | None
+) -> BytesIO:
+    """Build the Excel workbook from stored extraction results.
+
+    Args:
+        summary_json: Serialized ProjectSummary, or None if not extracted.
+        checklist_json: Serialized RequirementsChecklist, or None if not extracted.
+
+    Returns:
+        BytesIO buffer containing the .xlsx workbook.
+    """
+    wb = Workbook(write_only=True)
+
+    # ── Summary Sheet ───────────────────────────────────────────
+    summary_headers = [
         "Field", "Value", "Confidence", "Source Document", "Page", "Requires Review",
-    ])
+    ]
+    summary_rows: list[list] = []
 
-    if project.summary_json:
-        summary = ProjectSummary.model_validate_json(project.summary_json)
+    if summary_json:
+        summary = ProjectSummary.model_validate_json(summary_json)
         for field_key, label in FIELD_LABELS.items():
             field = getattr(summary, field_key, None)
             if field is None:
-                ws_summary.append([label, "", "", "", "", ""])
+                summary_rows.append([label, "", "", "", "", ""])
                 continue
             first_citation = field.citations[0] if field.citations else None
-            ws_summary.append([
+            summary_rows.append([
                 label,
                 field.value or "",
                 field.confidence_level,
@@ -110,26 +147,19 @@ async def generate_excel_report(project_id: int) -> BytesIO:
                 "Yes" if field.requires_review else "No",
             ])
     else:
-        ws_summary.append(["No extraction results available", "", "", "", "", ""])
+        summary_rows.append(["No extraction results available", "", "", "", "", ""])
 
-    _auto_fit_columns(ws_summary)
+    _write_sheet(wb, "Project Summary", summary_headers, summary_rows)
 
     # ── Checklist Sheet ─────────────────────────────────────────
-    ws_checklist = wb.create_sheet("Requirements Checklist")
-
     checklist_headers = [
         "#", "Requirement", "Description", "Category", "Mandatory",
         "Confidence", "Source", "Page", "Status",
     ]
-    # Write header manually (since ws is not empty-first-row for create_sheet)
-    ws_checklist.append(checklist_headers)
-    for cell in ws_checklist[1]:
-        cell.font = HEADER_FONT
-        cell.fill = HEADER_FILL
-        cell.alignment = HEADER_ALIGNMENT
+    checklist_rows: list[list] = []
 
-    if project.checklist_json:
-        checklist = RequirementsChecklist.model_validate_json(project.checklist_json)
+    if checklist_json:
+        checklist = RequirementsChecklist.model_validate_json(checklist_json)
         row_num = 0
         categories = [
             ("requirements", "Requirements"),
@@ -143,7 +173,7 @@ async def generate_excel_report(project_id: int) -> BytesIO:
                 # Determine checked status from the raw JSON dict
                 checked = getattr(item, "checked", False) if hasattr(item, "checked") else False
                 citation = item.citation
-                ws_checklist.append([
+                checklist_rows.append([
                     row_num,
                     item.requirement,
                     item.description,
@@ -155,9 +185,9 @@ async def generate_excel_report(project_id: int) -> BytesIO:
                     "Checked" if checked else "Unchecked",
                 ])
     else:
-        ws_checklist.append(["", "No checklist results available", "", "", "", "", "", "", ""])
+        checklist_rows.append(["", "No checklist results available", "", "", "", "", "", "", ""])
 
-    _auto_fit_columns(ws_checklist)
+    _write_sheet(wb, "Requirements Checklist", checklist_headers, checklist_rows)
 
     # ── Save to buffer ──────────────────────────────────────────
     buffer = BytesIO()
@@ -8,8 +8,16 @@ Generates an A4 PDF report using WeasyPrint with:
 
 WeasyPrint is an optional dependency. If not installed, the function
 raises a RuntimeError with installation instructions.
+
+Key design decisions:
+- The Jinja environment and parsed stylesheet are built once per process
+  and reused across reports.
+- WeasyPrint HTML parsing, layout and serialization are CPU-heavy, so all
+  WeasyPrint work runs in a worker thread to keep the event loop
+  responsive.
 """
 
+import asyncio
 from io import BytesIO
 from pathlib import Path
 
@@ -38,6 +46,54 @@ FIELD_LABELS: dict[str, str] = {
     "stakeholders": "Stakeholders",
 }
 
+_APP_DIR = Path(__file__).resolve().parent.parent.parent
+_TEMPLATES_DIR = _APP_DIR / "templates" / "reports"
+_CSS_PATH = _APP_DIR / "static" / "css" / "pdf_report.css"
+
+# Lazy singletons, built on first report.
+_template_env: Environment | None = None
+_stylesheets: list | None = None
+
+
+def _get_template_env() -> Environment:
+    """Return the shared Jinja environment for report templates."""
+    global _template_env
+    if _template_env is None:
+        _template_env = Environment(loader=FileSystemLoader(str(_TEMPLATES_DIR)))
+    return _template_env
+
+
+def _get_stylesheets(weasyprint) -> list:
+    """Return the parsed report stylesheets, loading them on first use.
+
+    Args:
+        weasyprint: The imported weasyprint module.
+
+    Returns:
+        List of weasyprint.CSS objects (empty if the CSS file is missing).
+    """
+    global _stylesheets
+    if _stylesheets is None:
+        stylesheets = []
+        if _CSS_PATH.exists():
+            stylesheets.append(weasyprint.CSS(filename=str(_CSS_PATH)))
+        _stylesheets = stylesheets
+    return _stylesheets
+
+
+def _render_pdf(weasyprint, html_string: str) -> bytes:
+    """Parse the rendered HTML and lay it out as PDF (blocking).
+
+    Args:
+        weasyprint: The imported weasyprint module.
+        html_string: The rendered report HTML.
+
+    Returns:
+        The PDF document bytes.
+    """
+    html_doc = weasyprint.HTML(string=html_string)
+    return html_doc.write_pdf(stylesheets=_get_stylesheets(weasyprint))
+
 
 async def generate_pdf_report(project_id: int) -> BytesIO:
     """Generate a formatted PDF report for the given project.
@@ -64,9 +120,10 @@ async def generate_pdf_report(project_id: int) -> BytesIO:
 
     async with async_session_factory() as session:
         result = await session.execute(
-            select(Project).where(Project.id == project_id)
+            select(Project.name, Project.summary_json, Project.checklist_json)
+            .where(Project.id == project_id)
         )
-        project = result.scalar_one_or_none()
+        project = result.one_or_none()
         if project is None:
             raise ValueError(f"Project with id {project_id} not found")
 
@@ -97,9 +154,7 @@ async def generate_pdf_report(project_id: int) -> BytesIO:
         }
 
     # Render HTML template
-    templates_dir = Path(__file__).resolve().parent.parent.parent / "templates" / "reports"
-    env = Environment(loader=FileSystemLoader(str(templates_dir)))
-    template = env.get_template("pdf_report.html")
+    template = _get_template_env().get_template("pdf_report.html")
 
     from datetime import datetime
 
@@ -111,15 +166,8 @@ async def generate_pdf_report(project_id: int) -> BytesIO:
         generated_at=datetime.now().strftime("%Y-%m-%d %H:%M"),
     )
 
-    # Load CSS stylesheet
-    css_path = Path(__file__).resolve().parent.parent.parent / "static" / "css" / "pdf_report.css"
-    stylesheets = []
-    if css_path.exists():
-        stylesheets.append(weasyprint.CSS(filename=str(css_path)))
-
-    # Generate PDF
-    html_doc = weasyprint.HTML(string=html_string)
-    pdf_bytes = html_doc.write_pdf(stylesheets=stylesheets)
+    # Generate PDF off the event loop
+    pdf_bytes = await asyncio.to_thread(_render_pdf, weasyprint, html_string)
 
     buffer = BytesIO(pdf_bytes)
     buffer.seek(0)
@@ -6,7 +6,10 @@ from app.services.extraction.checklist_definitions import (
 )
 from app.services.extraction.checklist_service import ChecklistService
 from app.services.extraction.citation_verifier import CitationVerifier
-from app.services.extraction.extraction_service import ExtractionService
+from app.services.extraction.extraction_service import (
+    ExtractionInProgressError,
+    ExtractionService,
+)
 from app.services.extraction.field_definitions import FieldDefinition, SUMMARY_FIELDS
 
 __all__ = [
@@ -14,6 +17,7 @@ __all__ = [
     "CategoryDefinition",
     "ChecklistService",
     "CitationVerifier",
+    "ExtractionInProgressError",
     "ExtractionService",
     "FieldDefinition",
     "SUMMARY_FIELDS",
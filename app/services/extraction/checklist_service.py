@@ -9,6 +9,10 @@ For each of the 6 requirement categories, the ChecklistService:
 6. Deduplicates semantically similar requirements across categories.
 7. Assembles the final RequirementsChecklist grouped by type.
 
+A per-run circuit breaker stops calling the LLM after repeated consecutive
+failures (llm_max_consecutive_failures setting); skipped categories yield
+no requirements.
+
 The extract_and_persist_checklist() method additionally saves results to the
 database and tracks checklist_status (in_progress -> completed/failed).
 """
@@ -28,7 +32,10 @@ from app.schemas.checklist import (
     VerifiedRequirement,
 )
 from app.schemas.extraction import Citation
+from app.services.errors import ExtractionInProgressError
 from app.services.extraction.checklist_definitions import CHECKLIST_CATEGORIES
+from app.services.extraction.citation_verifier import SourceChunkIndex
+from app.services.llm.circuit_breaker import LLMCircuitBreaker
 from app.services.llm.context_builder import (
     build_checklist_extraction_prompt,
     build_labeled_context,
@@ -50,6 +57,10 @@ class ChecklistService:
         search_service: HybridSearchService for multi-query chunk retrieval.
         llm_service: GeminiService for structured LLM extraction.
         citation_verifier: CitationVerifier for NLI-based citation verification.
+        max_concurrency: Maximum number of categories extracted at the same
+            time (bounds concurrent LLM calls to stay under rate limits).
+        max_consecutive_failures: Consecutive LLM failures after which the
+            remaining categories of a run are skipped.
     """
 
     def __init__(
@@ -57,10 +68,14 @@ class ChecklistService:
         search_service: HybridSearchService,
         llm_service: GeminiService,
         citation_verifier: CitationVerifier,
+        max_concurrency: int = 4,
+        max_consecutive_failures: int = 5,
     ) -> None:
         self._search_service = search_service
         self._llm_service = llm_service
         self._citation_verifier = citation_verifier
+        self._max_concurrency = max_concurrency
+        self._max_consecutive_failures = max_consecutive_failures
         logger.info("ChecklistService initialized")
 
     # ------------------------------------------------------------------
@@ -108,7 +123,10 @@ class ChecklistService:
     # ------------------------------------------------------------------
 
     async def _extract_category(
-        self, project_id: int, category: CategoryDefinition
+        self,
+        project_id: int,
+        category: CategoryDefinition,
+        breaker: LLMCircuitBreaker,
     ) -> list[VerifiedRequirement]:
         """Extract and verify requirements for one category.
 
@@ -116,20 +134,25 @@ class ChecklistService:
         1. Multi-query retrieval -> deduplicated chunks.
         2. Build labeled context for LLM attribution.
         3. LLM extraction via Gemini with CategoryExtractionResponse.
-        4. NLI verification per requirement item.
+        4. Batched NLI verification of all requirement items.
         5. Three-signal confidence scoring.
 
-        Individual category failures produce an empty list (graceful degradation).
+        Individual category failures produce an empty list (graceful degradation),
+        as does a tripped circuit breaker.
 
         Args:
             project_id: Database ID of the project.
             category: The category definition to extract.
+            breaker: Circuit breaker shared by all categories of the run.
 
         Returns:
             List of VerifiedRequirement objects for this category.
         """
         # 1. Retrieve chunks
-        chunks = self._retrieve_category_chunks(project_id, category)
+        # Search, NLI and embedding work is blocking; run it in threads.
+        chunks = await asyncio.to_thread(
+            self._retrieve_category_chunks, project_id, category
+        )
         if not chunks:
             logger.info(
                 "No chunks found for category %s, skipping",
@@ -142,6 +165,12 @@ class ChecklistService:
         prompt = build_checklist_extraction_prompt(category, context)
 
         # 3. LLM extraction
+        if not await breaker.allow_call():
+            logger.info(
+                "LLM circuit breaker open, skipping category %s",
+                category.display_name,
+            )
+            return []
         try:
             response: CategoryExtractionResponse = await asyncio.to_thread(
                 self._llm_service.extract,
@@ -149,16 +178,36 @@ class ChecklistService:
                 response_model=CategoryExtractionResponse,
             )
         except Exception:
+            await breaker.record_failure()
             logger.warning(
                 "LLM extraction failed for category %s, returning empty list",
                 category.display_name,
                 exc_info=True,
             )
             return []
+        await breaker.record_success()
 
         # 4. Verify each requirement item
+        # Resolve each item's source chunk, then score all citations with a
+        # single batched NLI call.
+        source_index = SourceChunkIndex(chunks)
+        sources = [
+            source_index.find(item.source_document, item.page_number)
+            for item in response.items
+        ]
+        nli_scores = iter(
+            await asyncio.to_thread(
+                self._citation_verifier.verify_citations,
+                [
+                    (item.quote, source.text)
+                    for item, source in zip(response.items, sources)
+                    if source is not None
+                ],
+            )
+        )
+
         verified: list[VerifiedRequirement] = []
-        for item in response.items:
+        for item, source in zip(response.items, sources):
             # Build citation from the LLM-extracted item
             citation = Citation(
                 document_name=item.source_document,
@@ -166,28 +215,8 @@ class ChecklistService:
                 quote=item.quote,
             )
 
-            # Find matching source chunk (same logic as CitationVerifier._find_source_chunk)
-            source: SearchResult | None = None
-            # Exact match: filename AND page number
-            for chunk in chunks:
-                if (
-                    chunk.filename == item.source_document
-                    and chunk.page_number == item.page_number
-                ):
-                    source = chunk
-                    break
-            # Fallback: filename only
-            if source is None:
-                for chunk in chunks:
-                    if chunk.filename == item.source_document:
-                        source = chunk
-                        break
-
-            # NLI verification
             if source is not None:
-                nli_score = self._citation_verifier.verify_citation(
-                    claim=item.quote, source_text=source.text
-                )
+                nli_score = next(nli_scores)
                 retrieval_score = source.score
             else:
                 nli_score = 0.0
@@ -226,7 +255,7 @@ class ChecklistService:
     ) -> list[VerifiedRequirement]:
         """Remove near-duplicate requirements across categories using cosine similarity.
 
-        Encodes all requirement texts with the project's sentence-transformer
+        Embeds all requirement texts with the project's sentence-transformer
         model and removes items whose cosine similarity >= 0.9 with a
         higher-confidence item.
 
@@ -241,18 +270,20 @@ class ChecklistService:
         if len(requirements) <= 1:
             return requirements
 
-        # Get sentence-transformer model for encoding
+        # Embed all requirement texts as unit-length rows so a single
+        # matrix product yields every pairwise cosine similarity.
+        texts = [r.requirement for r in requirements]
         try:
-            model = self._search_service._embedding_service._get_model()
+            embeddings = self._search_service._embedding_service.embed_documents(
+                texts
+            )
         except Exception:
             logger.warning(
-                "Embedding model unavailable for deduplication, skipping"
+                "Embedding model unavailable for deduplication, skipping",
+                exc_info=True,
             )
             return requirements
-
-        # Encode all requirement texts
-        texts = [r.requirement for r in requirements]
-        embeddings = model.encode(texts)
+        similarity = embeddings @ embeddings.T
 
         # Mark duplicates (lower-confidence item in each duplicate pair)
         duplicate_indices: set[int] = set()
@@ -260,25 +291,16 @@ class ChecklistService:
         for i in range(n):
             if i in duplicate_indices:
                 continue
-            for j in range(i + 1, n):
+            for j in np.flatnonzero(similarity[i, i + 1 :] >= 0.9) + i + 1:
+                j = int(j)
                 if j in duplicate_indices:
                     continue
-                # Cosine similarity
-                a = embeddings[i]
-                b = embeddings[j]
-                norm_a = np.linalg.norm(a)
-                norm_b = np.linalg.norm(b)
-                if norm_a == 0 or norm_b == 0:
-                    continue
-                similarity = float(np.dot(a, b) / (norm_a * norm_b))
-
-                if similarity >= 0.9:
-                    # Mark the lower-confidence item as duplicate
-                    if requirements[i].confidence >= requirements[j].confidence:
-                        duplicate_indices.add(j)
-                    else:
-                        duplicate_indices.add(i)
-                        break  # i is now a duplicate, stop comparing it
+                # Mark the lower-confidence item as duplicate
+                if requirements[i].confidence >= requirements[j].confidence:
+                    duplicate_indices.add(j)
+                else:
+                    duplicate_indices.add(i)
+                    break  # i is now a duplicate, stop comparing it
 
         unique = [r for idx, r in enumerate(requirements) if idx not in duplicate_indices]
         removed = len(requirements) - len(unique)
@@ -315,17 +337,24 @@ class ChecklistService:
         submission_docs: list[VerifiedRequirement] = []
         eligibility: list[VerifiedRequirement] = []
 
+        mandatory_count = 0
+        categories: set[str] = set()
+
+        # Group, count and collect categories in a single pass.
         for req in requirements:
-            if req.category == "submission_documents":
+            category = req.category
+            if category == "submission_documents":
                 submission_docs.append(req)
-            elif req.category == "eligibility":
+            elif category == "eligibility":
                 eligibility.append(req)
             else:
                 general.append(req)
+            if req.is_mandatory:
+                mandatory_count += 1
+            categories.add(category)
 
         total_count = len(requirements)
-        mandatory_count = sum(1 for r in requirements if r.is_mandatory)
-        categories_extracted = sorted({r.category for r in requirements})
+        categories_extracted = sorted(categories)
 
         return RequirementsChecklist(
             requirements=general,
@@ -344,7 +373,8 @@ class ChecklistService:
         """Extract complete requirements checklist from indexed documents.
 
         Orchestrates the full pipeline:
-        1. Per-category multi-query retrieval + LLM extraction + NLI verification.
+        1. Per-category multi-query retrieval + LLM extraction + NLI verification,
+           run concurrently across categories (bounded by max_concurrency).
         2. Semantic deduplication across all categories.
         3. Checklist assembly with grouping and counts.
 
@@ -355,23 +385,34 @@ class ChecklistService:
             Complete RequirementsChecklist with verified, deduplicated requirements.
         """
         start_time = time.time()
-        all_requirements: list[VerifiedRequirement] = []
-
-        for i, category in enumerate(CHECKLIST_CATEGORIES):
-            category_results = await self._extract_category(project_id, category)
-            all_requirements.extend(category_results)
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        breaker = LLMCircuitBreaker(self._max_consecutive_failures)
+
+        async def extract_bounded(
+            category: CategoryDefinition,
+        ) -> list[VerifiedRequirement]:
+            async with semaphore:
+                category_results = await self._extract_category(
+                    project_id, category, breaker
+                )
             logger.info(
                 "Extracted %d %s requirements",
                 len(category_results),
                 category.display_name,
             )
+            return category_results
 
-            # Rate limiting between categories
-            if i < len(CHECKLIST_CATEGORIES) - 1:
-                await asyncio.sleep(0.5)
+        # Categories are independent; extract them concurrently. gather()
+        # keeps category order so deduplication sees the same sequence.
+        per_category = await asyncio.gather(
+            *(extract_bounded(category) for category in CHECKLIST_CATEGORIES)
+        )
+        all_requirements: list[VerifiedRequirement] = [
+            req for category_results in per_category for req in category_results
+        ]
 
         # Deduplicate across categories
-        unique = self._deduplicate(all_requirements)
+        unique = await asyncio.to_thread(self._deduplicate, all_requirements)
 
         # Assemble final checklist
         checklist = self._assemble_checklist(unique)
@@ -405,27 +446,47 @@ class ChecklistService:
 
         Raises:
             ValueError: If the project does not exist.
+            ExtractionInProgressError: If checklist extraction is already running.
             Exception: Re-raised after setting status to "failed".
         """
+        from sqlalchemy import update
+
         from app.database import async_session_factory
         from app.models.project import Project
 
-        # Set checklist status to in_progress
+        # Atomically claim the run: the conditional UPDATE only matches while
+        # checklist_status is not "in_progress", so two concurrent requests
+        # cannot both start a checklist run for the same project.
         async with async_session_factory() as session:
-            project = await session.get(Project, project_id)
-            if project is None:
-                raise ValueError(f"Project {project_id} not found")
-            project.checklist_status = "in_progress"
+            result = await session.execute(
+                update(Project)
+                .where(
+                    Project.id == project_id,
+                    Project.checklist_status.is_distinct_from("in_progress"),
+                )
+                .values(checklist_status="in_progress")
+            )
             await session.commit()
+            if result.rowcount == 0:
+                if await session.get(Project, project_id) is None:
+                    raise ValueError(f"Project {project_id} not found")
+                raise ExtractionInProgressError(
+                    f"Checklist extraction already in progress for project {project_id}"
+                )
 
         try:
             checklist = await self.extract_checklist(project_id)
 
             # Persist results
             async with async_session_factory() as session:
-                project = await session.get(Project, project_id)
-                project.checklist_json = checklist.model_dump_json()
-                project.checklist_status = "completed"
+                await session.execute(
+                    update(Project)
+                    .where(Project.id == project_id)
+                    .values(
+                        checklist_json=checklist.model_dump_json(),
+                        checklist_status="completed",
+                    )
+                )
                 await session.commit()
 
             return checklist
@@ -436,8 +497,10 @@ class ChecklistService:
             )
             # Update status to failed
             async with async_session_factory() as session:
-                project = await session.get(Project, project_id)
-                if project:
-                    project.checklist_status = "failed"
-                    await session.commit()
+                await session.execute(
+                    update(Project)
+                    .where(Project.id == project_id)
+                    .values(checklist_status="failed")
+                )
+                await session.commit()
             raise
@@ -13,11 +13,14 @@ Key design decisions:
 - Model loads lazily on first use to avoid startup delay.
 - Softmax applied to raw logits (nli-deberta-v3-xsmall outputs logits, not probs).
 - Confidence weights: NLI 50%, retrieval 30%, LLM 20% (NLI most trusted).
+- SourceChunkIndex maps (filename, page) and filename to the first matching
+  chunk so citation lookups are O(1) instead of a scan per citation.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -30,6 +33,42 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class SourceChunkIndex:
+    """First-occurrence lookup of source chunks by document and page.
+
+    Returns the same chunk a linear scan would: the first chunk matching
+    filename and page number, falling back to the first chunk with a
+    matching filename (LLM may cite the wrong page).
+
+    Args:
+        chunks: Source chunks in retrieval order.
+    """
+
+    def __init__(self, chunks: list[SearchResult]) -> None:
+        self._by_page: dict[tuple[str, int | None], SearchResult] = {}
+        self._by_filename: dict[str, SearchResult] = {}
+        for chunk in chunks:
+            self._by_page.setdefault((chunk.filename, chunk.page_number), chunk)
+            self._by_filename.setdefault(chunk.filename, chunk)
+
+    def find(
+        self, document_name: str, page_number: int | None
+    ) -> SearchResult | None:
+        """Find the source chunk for a cited document and page.
+
+        Args:
+            document_name: Cited document filename.
+            page_number: Cited page number.
+
+        Returns:
+            The matching SearchResult, or None if no chunk is from that document.
+        """
+        source = self._by_page.get((document_name, page_number))
+        if source is None:
+            source = self._by_filename.get(document_name)
+        return source
+
+
 class CitationVerifier:
     """Verifies LLM-generated citations using an independent NLI cross-encoder.
 
@@ -58,6 +97,9 @@ class CitationVerifier:
         self._confidence_low = confidence_low
         self._review_threshold = review_threshold
         self._model: CrossEncoder | None = None
+        # Guards lazy model loading -- concurrent extraction tasks verify
+        # citations from several worker threads at once.
+        self._init_lock = threading.Lock()
         logger.info("CitationVerifier initialized with model: %s", model_name)
 
     def _get_model(self) -> CrossEncoder:
@@ -66,10 +108,14 @@ class CitationVerifier:
         Returns:
             The loaded CrossEncoder model instance.
         """
-        if self._model is None:
-            logger.info("Loading NLI model: %s", self._model_name)
-            self._model = CrossEncoder(self._model_name)
-            logger.info("NLI model loaded")
+        if self._model is not None:
+            return self._model
+
+        with self._init_lock:
+            if self._model is None:
+                logger.info("Loading NLI model: %s", self._model_name)
+                self._model = CrossEncoder(self._model_name)
+                logger.info("NLI model loaded")
         return self._model
 
     def verify_citation(self, claim: str, source_text: str) -> float:
@@ -87,53 +133,39 @@ class CitationVerifier:
         Returns:
             Entailment probability between 0.0 and 1.0.
         """
+        return self.verify_citations([(claim, source_text)])[0]
+
+    def verify_citations(self, pairs: list[tuple[str, str]]) -> list[float]:
+        """Score several (claim, source_text) pairs with a single NLI batch.
+
+        Runs one cross-encoder prediction over all pairs instead of one call
+        per citation, letting the model batch them.
+
+        Args:
+            pairs: List of (claim, source_text) tuples to verify.
+
+        Returns:
+            Entailment probabilities (0.0-1.0), one per pair, in input order.
+            All 0.0 if the NLI model fails.
+        """
+        if not pairs:
+            return []
         try:
             model = self._get_model()
-            scores = model.predict([(source_text, claim)])
+            logits = np.asarray(
+                model.predict([(source_text, claim) for claim, source_text in pairs])
+            )
             # NLI model outputs logits for [contradiction, entailment, neutral]
-            logits = scores[0]  # shape: (3,)
-            # Apply softmax with numerical stability
-            exp_logits = np.exp(logits - np.max(logits))
-            probs = exp_logits / exp_logits.sum()
-            entailment_prob = float(probs[1])  # index 1 = entailment
-            return entailment_prob
+            # per pair. Apply row-wise softmax with numerical stability.
+            exp_logits = np.exp(logits - logits.max(axis=1, keepdims=True))
+            probs = exp_logits / exp_logits.sum(axis=1, keepdims=True)
+            return [float(p) for p in probs[:, 1]]  # index 1 = entailment
         except Exception:
             logger.warning(
                 "NLI model failed for claim verification, returning 0.0",
                 exc_info=True,
             )
-            return 0.0
-
-    def _find_source_chunk(
-        self, citation: Citation, source_chunks: list[SearchResult]
-    ) -> SearchResult | None:
-        """Find the source chunk matching a citation's document and page.
-
-        Tries exact match on filename + page_number first, then falls back
-        to filename-only match (LLM may cite wrong page number).
-
-        Args:
-            citation: The citation to find a source for.
-            source_chunks: Available search result chunks to match against.
-
-        Returns:
-            The matching SearchResult, or None if no match found.
-        """
-        # Try exact match: filename AND page number
-        for chunk in source_chunks:
-            if (
-                chunk.filename == citation.document_name
-                and chunk.page_number == citation.page_number
-            ):
-                return chunk
-
-        # Fallback: match by filename only (LLM may cite wrong page)
-        for chunk in source_chunks:
-            if chunk.filename == citation.document_name:
-                return chunk
-
-        # No match found -- citation references non-existent source
-        return None
+            return [0.0] * len(pairs)
 
     def verify_field(
         self,
@@ -173,8 +205,9 @@ class CitationVerifier:
         verified_citations: list[Citation] = []
         entailment_scores: list[float] = []
 
+        source_index = SourceChunkIndex(source_chunks)
         for citation in field.citations:
-            source = self._find_source_chunk(citation, source_chunks)
+            source = source_index.find(citation.document_name, citation.page_number)
             if source is None:
                 # Citation references non-existent source, skip it
                 logger.debug(
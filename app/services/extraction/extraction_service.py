@@ -7,6 +7,12 @@ For each of the 13 project summary fields, the ExtractionService:
 4. Verifies citations and computes confidence via CitationVerifier.
 5. Stores verified ExtractedField results in a ProjectSummary.
 
+Fields are independent, so they are extracted concurrently with a semaphore
+bounding the number of in-flight LLM calls (llm_max_concurrency setting).
+A per-run circuit breaker stops calling the LLM after repeated consecutive
+failures (llm_max_consecutive_failures setting); skipped fields come back
+empty and flagged for review.
+
 The extract_and_persist() method additionally saves results to the database
 and tracks extraction status (in_progress -> completed/failed).
 """
@@ -24,7 +30,9 @@ from app.schemas.extraction import (
     LLMExtractedField,
     ProjectSummary,
 )
+from app.services.errors import ExtractionInProgressError
 from app.services.extraction.field_definitions import SUMMARY_FIELDS, FieldDefinition
+from app.services.llm.circuit_breaker import LLMCircuitBreaker
 from app.services.llm.context_builder import build_extraction_prompt, build_labeled_context
 
 if TYPE_CHECKING:
@@ -42,6 +50,10 @@ class ExtractionService:
         search_service: HybridSearchService for per-field chunk retrieval.
         llm_service: GeminiService for structured LLM extraction.
         citation_verifier: CitationVerifier for NLI-based citation verification.
+        max_concurrency: Maximum number of fields extracted at the same time
+            (bounds concurrent LLM calls to stay under rate limits).
+        max_consecutive_failures: Consecutive LLM failures after which the
+            remaining fields of a run are skipped.
     """
 
     def __init__(
@@ -49,10 +61,14 @@ class ExtractionService:
         search_service: HybridSearchService,
         llm_service: GeminiService,
         citation_verifier: CitationVerifier,
+        max_concurrency: int = 4,
+        max_consecutive_failures: int = 5,
     ) -> None:
         self._search_service = search_service
         self._llm_service = llm_service
         self._citation_verifier = citation_verifier
+        self._max_concurrency = max_concurrency
+        self._max_consecutive_failures = max_consecutive_failures
         logger.info("ExtractionService initialized")
 
     async def extract_project_summary(self, project_id: int) -> ProjectSummary:
@@ -65,6 +81,11 @@ class ExtractionService:
         4. Verify citations via NLI cross-encoder.
         5. Store verified result.
 
+        Fields are independent, so they are extracted concurrently with at
+        most ``max_concurrency`` LLM calls in flight. After
+        ``max_consecutive_failures`` LLM errors in a row the remaining fields
+        are returned empty without calling the LLM.
+
         Args:
             project_id: Database ID of the project to extract from.
 
@@ -72,103 +93,144 @@ class ExtractionService:
             ProjectSummary with all 13 fields populated.
         """
         start_time = time.time()
-        results: dict[str, ExtractedField] = {}
-
-        for i, field_def in enumerate(SUMMARY_FIELDS):
-            # 1. Retrieve relevant chunks
-            chunks: list[SearchResult] = self._search_service.search(
-                project_id=project_id,
-                query=field_def.query,
-                top_k=field_def.top_k,
-                mode="hybrid",
-            )
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        breaker = LLMCircuitBreaker(self._max_consecutive_failures)
 
-            if not chunks:
-                logger.info(
-                    "No chunks found for field %s, creating empty field",
-                    field_def.name,
-                )
-                results[field_def.name] = ExtractedField(
-                    value=None,
-                    confidence=0.0,
-                    confidence_level="low",
-                    requires_review=True,
-                )
-                continue
+        async def extract_bounded(field_def: FieldDefinition) -> ExtractedField:
+            async with semaphore:
+                return await self._extract_field(project_id, field_def, breaker)
 
-            # 2. Build labeled context
-            context = build_labeled_context(chunks)
+        extracted = await asyncio.gather(
+            *(extract_bounded(field_def) for field_def in SUMMARY_FIELDS)
+        )
+        results: dict[str, ExtractedField] = {
+            field_def.name: field
+            for field_def, field in zip(SUMMARY_FIELDS, extracted)
+        }
 
-            # 3. Build extraction prompt
-            prompt = build_extraction_prompt(field_def, context)
+        elapsed = time.time() - start_time
+        logger.info(
+            "Extraction complete for project %d: %d fields in %.1fs",
+            project_id,
+            len(results),
+            elapsed,
+        )
 
-            # 4. Extract via LLM
-            try:
-                llm_result: LLMExtractedField = await asyncio.to_thread(
-                    self._llm_service.extract,
-                    prompt=prompt,
-                    response_model=LLMExtractedField,
-                )
-            except Exception:
-                logger.warning(
-                    "LLM extraction failed for field %s, creating empty field",
-                    field_def.name,
-                    exc_info=True,
-                )
-                results[field_def.name] = ExtractedField(
-                    value=None,
-                    confidence=0.0,
-                    confidence_level="low",
-                    requires_review=True,
-                )
-                continue
+        return ProjectSummary(**results)
+
+    async def _extract_field(
+        self,
+        project_id: int,
+        field_def: FieldDefinition,
+        breaker: LLMCircuitBreaker,
+    ) -> ExtractedField:
+        """Retrieve, extract and verify a single summary field.
+
+        Failures (no chunks, LLM error, tripped circuit breaker) produce an
+        empty low-confidence field.
 
-            # 5. Convert LLMExtractedField to ExtractedField
-            extracted_field = ExtractedField(
-                value=llm_result.value,
-                confidence=llm_result.confidence,
+        Args:
+            project_id: Database ID of the project to extract from.
+            field_def: The field definition to extract.
+            breaker: Circuit breaker shared by all fields of the run.
+
+        Returns:
+            The verified ExtractedField.
+        """
+        # 1. Retrieve relevant chunks
+        # Search and NLI verification are blocking; run them in threads.
+        chunks: list[SearchResult] = await asyncio.to_thread(
+            self._search_service.search,
+            project_id=project_id,
+            query=field_def.query,
+            top_k=field_def.top_k,
+            mode="hybrid",
+        )
+
+        if not chunks:
+            logger.info(
+                "No chunks found for field %s, creating empty field",
+                field_def.name,
+            )
+            return ExtractedField(
+                value=None,
+                confidence=0.0,
                 confidence_level="low",
-                citations=llm_result.citations,
-                reasoning=llm_result.reasoning,
                 requires_review=True,
             )
 
-            # 6. Verify citations via NLI
-            retrieval_scores = [chunk.score for chunk in chunks]
-            verified_field = self._citation_verifier.verify_field(
-                field=extracted_field,
-                source_chunks=chunks,
-                retrieval_scores=retrieval_scores,
-            )
+        # 2. Build labeled context
+        context = build_labeled_context(chunks)
 
-            # 7. Store result
-            results[field_def.name] = verified_field
+        # 3. Build extraction prompt
+        prompt = build_extraction_prompt(field_def, context)
 
-            value_preview = (
-                verified_field.value[:60] + "..."
-                if verified_field.value and len(verified_field.value) > 60
-                else verified_field.value
-            )
+        # 4. Extract via LLM
+        if not await breaker.allow_call():
             logger.info(
-                "Extracted %s: value='%s', confidence=%s",
+                "LLM circuit breaker open, skipping field %s",
                 field_def.name,
-                value_preview or "None",
-                verified_field.confidence_level,
+            )
+            return ExtractedField(
+                value=None,
+                confidence=0.0,
+                confidence_level="low",
+                requires_review=True,
+            )
+        try:
+            llm_result: LLMExtractedField = await asyncio.to_thread(
+                self._llm_service.extract,
+                prompt=prompt,
+                response_model=LLMExtractedField,
+            )
+        except Exception:
+            await breaker.record_failure()
+            logger.warning(
+                "LLM extraction failed for field %s, creating empty field",
+                field_def.name,
+                exc_info=True,
+            )
+            return ExtractedField(
+                value=None,
+                confidence=0.0,
+                confidence_level="low",
+                requires_review=True,
             )
 
-            # Small delay between LLM calls to avoid rate limiting
-            if i < len(SUMMARY_FIELDS) - 1:
-                await asyncio.sleep(0.5)
+        await breaker.record_success()
 
-        elapsed = time.time() - start_time
+        # 5. Convert LLMExtractedField to ExtractedField
+        extracted_field = ExtractedField(
+            value=llm_result.value,
+            confidence=llm_result.confidence,
+            confidence_level="low",
+            citations=llm_result.citations,
+            reasoning=llm_result.reasoning,
+            requires_review=True,
+        )
+
+        # 6. Verify citations via NLI
+        retrieval_scores = [chunk.score for chunk in chunks]
+        verified_field = await asyncio.to_thread(
+            self._citation_verifier.verify_field,
+            field=extracted_field,
+            source_chunks=chunks,
+            retrieval_scores=retrieval_scores,
+        )
+
+        value_preview = (
+            verified_field.value[:60] + "..."
+            if verified_field.value and len(verified_field.value) > 60
+            else verified_field.value
+        )
         logger.info(
-            "Extraction complete for project %d: %d fields in %.1fs",
-            project_id,
-            len(results),
-            elapsed,
+            "Extracted %s: value='%s', confidence=%s",
+            field_def.name,
+            value_preview or "None",
+            verified_field.confidence_level,
         )
 
-        return ProjectSummary(**results)
+        return verified_field
 
     async def extract_and_persist(self, project_id: int) -> ProjectSummary:
         """Extract project summary and persist to database.
@@ -184,27 +246,47 @@ class ExtractionService:
 
         Raises:
             ValueError: If the project does not exist.
+            ExtractionInProgressError: If extraction is already running.
             Exception: Re-raised after setting status to "failed".
         """
+        from sqlalchemy import update
+
         from app.database import async_session_factory
         from app.models.project import Project
 
-        # Set extraction status to in_progress
+        # Atomically claim the run: the conditional UPDATE only matches when
+        # no extraction is already in progress, so concurrent requests cannot
+        # both start one.
         async with async_session_factory() as session:
-            project = await session.get(Project, project_id)
-            if project is None:
-                raise ValueError(f"Project {project_id} not found")
-            project.extraction_status = "in_progress"
+            result = await session.execute(
+                update(Project)
+                .where(
+                    Project.id == project_id,
+                    Project.extraction_status.is_distinct_from("in_progress"),
+                )
+                .values(extraction_status="in_progress")
+            )
             await session.commit()
+            if result.rowcount == 0:
+                if await session.get(Project, project_id) is None:
+                    raise ValueError(f"Project {project_id} not found")
+                raise ExtractionInProgressError(
+                    f"Extraction already in progress for project {project_id}"
+                )
 
         try:
             summary = await self.extract_project_summary(project_id)
 
             # Persist results
             async with async_session_factory() as session:
-                project = await session.get(Project, project_id)
-                project.summary_json = summary.model_dump_json()
-                project.extraction_status = "completed"
+                await session.execute(
+                    update(Project)
+                    .where(Project.id == project_id)
+                    .values(
+                        summary_json=summary.model_dump_json(),
+                        extraction_status="completed",
+                    )
+                )
                 await session.commit()
 
             return summary
@@ -215,8 +297,10 @@ class ExtractionService:
             )
             # Update status to failed
             async with async_session_factory() as session:
-                project = await session.get(Project, project_id)
-                if project:
-                    project.extraction_status = "failed"
-                    await session.commit()
+                await session.execute(
+                    update(Project)
+                    .where(Project.id == project_id)
+                    .values(extraction_status="failed")
+                )
+                await session.commit()
             raise
@@ -15,6 +15,10 @@ Key design decisions:
   deletion without affecting other projects.
 - Cosine similarity: Best for multilingual embeddings where magnitude varies
   across languages.
+- Query embedding cache: extraction and checklist runs issue the same fixed
+  queries for every project, so query vectors are kept in a small LRU.
+- Collection handles are cached per project, so repeated searches skip the
+  get_or_create_collection() lookup; delete_collection() drops the entry.
 
 Pitfalls addressed (from 02-RESEARCH.md):
 - Pitfall 3: Always pass embedding_function to get_or_create_collection()
@@ -25,8 +29,12 @@ Pitfalls addressed (from 02-RESEARCH.md):
 from __future__ import annotations
 
 import logging
+import threading
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     import chromadb
 
@@ -37,6 +45,9 @@ logger = logging.getLogger(__name__)
 # ChromaDB batch size limit for upsert operations.
 _CHROMA_MAX_BATCH_SIZE = 5000
 
+# Default maximum number of query embeddings kept in the LRU cache.
+_QUERY_CACHE_MAX_SIZE = 512
+
 
 class EmbeddingService:
     """Manages ChromaDB vector collections with multilingual embeddings.
@@ -48,13 +59,28 @@ class EmbeddingService:
     Args:
         persist_dir: Directory path for ChromaDB persistent storage.
         model_name: Name of the sentence-transformers model to use.
+        query_cache_size: Maximum number of query embeddings to cache.
     """
 
-    def __init__(self, persist_dir: str, model_name: str) -> None:
+    def __init__(
+        self,
+        persist_dir: str,
+        model_name: str,
+        query_cache_size: int = _QUERY_CACHE_MAX_SIZE,
+    ) -> None:
         self._persist_dir = persist_dir
         self._model_name = model_name
+        self._query_cache_size = query_cache_size
         self._client: chromadb.ClientAPI | None = None
         self._ef = None  # SentenceTransformerEmbeddingFunction
+        # Guards lazy initialization -- hybrid search touches the service
+        # from more than one thread at a time.
+        self._init_lock = threading.Lock()
+        # LRU cache: normalized query text -> embedding vector.
+        self._query_cache: OrderedDict[str, list[float]] = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        # Cache: project_id -> collection handle.
+        self._collections: dict[int, chromadb.Collection] = {}
 
     def _get_client(self) -> chromadb.ClientAPI:
         """Get or create the ChromaDB persistent client.
@@ -68,10 +94,12 @@ class EmbeddingService:
         if self._client is not None:
             return self._client
 
-        import chromadb
+        with self._init_lock:
+            if self._client is None:
+                import chromadb
 
-        self._client = chromadb.PersistentClient(path=self._persist_dir)
-        logger.info("ChromaDB client initialized at %s", self._persist_dir)
+                self._client = chromadb.PersistentClient(path=self._persist_dir)
+                logger.info("ChromaDB client initialized at %s", self._persist_dir)
         return self._client
 
     def _get_embedding_function(self):
@@ -86,23 +114,43 @@ class EmbeddingService:
         if self._ef is not None:
             return self._ef
 
-        from chromadb.utils.embedding_functions import (
-            SentenceTransformerEmbeddingFunction,
-        )
-
-        self._ef = SentenceTransformerEmbeddingFunction(
-            model_name=self._model_name,
-            device="cpu",
-            normalize_embeddings=True,
-        )
-        logger.info("Embedding model loaded: %s", self._model_name)
+        with self._init_lock:
+            if self._ef is None:
+                from chromadb.utils.embedding_functions import (
+                    SentenceTransformerEmbeddingFunction,
+                )
+
+                self._ef = SentenceTransformerEmbeddingFunction(
+                    model_name=self._model_name,
+                    device="cpu",
+                    normalize_embeddings=True,
+                )
+                logger.info("Embedding model loaded: %s", self._model_name)
         return self._ef
 
+    def embed_documents(self, texts: list[str]) -> np.ndarray:
+        """Embed a batch of texts with the collections' embedding model.
+
+        Goes through the embedding function's public call interface (it
+        batches the encode internally), so callers share the loaded model
+        without depending on chromadb internals. Rows are unit length
+        because the function is built with ``normalize_embeddings=True``.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            A float32 array of shape (len(texts), dim).
+        """
+        ef = self._get_embedding_function()
+        return np.asarray(ef(texts), dtype=np.float32)
+
     def get_collection(self, project_id: int) -> chromadb.Collection:
         """Get or create the ChromaDB collection for a project.
 
         CRITICAL: Always passes embedding_function to avoid dimension
         mismatch when reopening an existing collection (Pitfall 3).
+        The handle is cached per project after the first lookup.
 
         Args:
             project_id: Database ID of the project.
@@ -110,14 +158,49 @@ class EmbeddingService:
         Returns:
             A chromadb.Collection configured with cosine similarity.
         """
+        collection = self._collections.get(project_id)
+        if collection is not None:
+            return collection
+
         client = self._get_client()
         ef = self._get_embedding_function()
 
-        return client.get_or_create_collection(
+        collection = client.get_or_create_collection(
             name=f"project_{project_id}",
             embedding_function=ef,
             metadata={"hnsw:space": "cosine"},
         )
+        self._collections[project_id] = collection
+        return collection
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a search query, reusing the vector if seen recently.
+
+        Uses the same embedding function as the collections, so the result
+        can be passed to ``collection.query(query_embeddings=...)`` in place
+        of ``query_texts``. Callers should pass the normalized query so that
+        trivially different spellings share a cache entry.
+
+        Args:
+            text: Normalized query text.
+
+        Returns:
+            The query embedding vector.
+        """
+        with self._query_cache_lock:
+            embedding = self._query_cache.get(text)
+            if embedding is not None:
+                self._query_cache.move_to_end(text)
+                return embedding
+
+        ef = self._get_embedding_function()
+        embedding = ef([text])[0]
+
+        with self._query_cache_lock:
+            self._query_cache[text] = embedding
+            if len(self._query_cache) > self._query_cache_size:
+                self._query_cache.popitem(last=False)
+        return embedding
 
     def index_chunks(
         self, project_id: int, chunks: list[DocumentChunk]
@@ -216,6 +299,7 @@ class EmbeddingService:
             project_id: Database ID of the project.
         """
         client = self._get_client()
+        self._collections.pop(project_id, None)
         try:
             client.delete_collection(name=f"project_{project_id}")
             logger.info("Deleted collection project_%d", project_id)
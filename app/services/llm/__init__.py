@@ -1,6 +1,12 @@
 """LLM service layer for structured extraction using Gemini."""
 
+from app.services.llm.circuit_breaker import LLMCircuitBreaker
 from app.services.llm.context_builder import build_extraction_prompt, build_labeled_context
 from app.services.llm.gemini_service import GeminiService
 
-__all__ = ["GeminiService", "build_labeled_context", "build_extraction_prompt"]
+__all__ = [
+    "GeminiService",
+    "LLMCircuitBreaker",
+    "build_labeled_context",
+    "build_extraction_prompt",
+]
@@ -0,0 +1,93 @@
+"""Per-run circuit breaker for LLM extraction calls.
+
+An extraction or checklist run fans out one LLM call per field/category.
+When the provider is down, every call fails only after the tenacity
+retries in GeminiService, so a single run can waste minutes. The breaker
+counts consecutive failures across the run and, once tripped, lets the
+remaining calls short-circuit to their empty fallback result.
+
+Key design decisions:
+- One breaker per run, so a failed run never blocks the next one.
+- Any success resets the count; only an unbroken streak trips it.
+- In-flight aware: while a failure streak is open, new calls wait for the
+  calls already in flight instead of starting. The streak then ends in a
+  success (calls resume), a trip (calls are skipped), or with nothing in
+  flight (one probe call is let through). Without this, concurrent calls
+  would all be issued before enough failures came back to trip it, e.g. all
+  6 checklist categories at concurrency 4.
+- Runs entirely on the event loop, so an asyncio.Condition is enough.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCircuitBreaker:
+    """Trips after a number of consecutive LLM failures.
+
+    Callers await ``allow_call()`` before each LLM call and report the
+    outcome with ``record_success()`` or ``record_failure()``. At most
+    ``max_consecutive_failures`` calls fail before the breaker trips,
+    regardless of how many run concurrently.
+
+    Args:
+        max_consecutive_failures: Failures in a row that trip the breaker.
+    """
+
+    def __init__(self, max_consecutive_failures: int = 5) -> None:
+        self._max_consecutive_failures = max_consecutive_failures
+        self._consecutive_failures = 0
+        self._in_flight = 0
+        self._tripped = False
+        self._condition = asyncio.Condition()
+
+    @property
+    def tripped(self) -> bool:
+        """Whether remaining LLM calls in this run should be skipped."""
+        return self._tripped
+
+    async def allow_call(self) -> bool:
+        """Wait until an LLM call may start.
+
+        Returns:
+            True if the caller should make the call (and report its outcome),
+            False if the breaker has tripped and the call should be skipped.
+        """
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: self._tripped
+                or self._consecutive_failures == 0
+                or self._in_flight == 0
+            )
+            if self._tripped:
+                return False
+            self._in_flight += 1
+            return True
+
+    async def record_success(self) -> None:
+        """Reset the consecutive failure count after a successful call."""
+        async with self._condition:
+            self._in_flight -= 1
+            self._consecutive_failures = 0
+            self._condition.notify_all()
+
+    async def record_failure(self) -> None:
+        """Count a failed call and trip the breaker at the threshold."""
+        async with self._condition:
+            self._in_flight -= 1
+            self._consecutive_failures += 1
+            if (
+                not self._tripped
+                and self._consecutive_failures >= self._max_consecutive_failures
+            ):
+                self._tripped = True
+                logger.error(
+                    "LLM circuit breaker tripped after %d consecutive failures; "
+                    "skipping remaining LLM calls for this run",
+                    self._consecutive_failures,
+                )
+            self._condition.notify_all()
@@ -14,6 +14,13 @@ if TYPE_CHECKING:
     from app.services.extraction.field_definitions import FieldDefinition
     from app.services.search.hybrid_search import SearchResult
 
+# Display names of all checklist categories, used to tell the LLM which
+# categories to skip when extracting one of them.
+_CATEGORY_DISPLAY_NAMES = (
+    "Technical", "Commercial", "Legal", "HSE",
+    "Submission Documents", "Eligibility",
+)
+
 
 def build_labeled_context(chunks: list[SearchResult]) -> str:
     """Build context string with labeled source chunks for LLM attribution.
@@ -104,12 +111,10 @@ def build_checklist_extraction_prompt(
         Complete prompt string ready for LLM extraction.
     """
     # Build list of other categories to explicitly skip
-    all_categories = [
-        "Technical", "Commercial", "Legal", "HSE",
-        "Submission Documents", "Eligibility",
-    ]
-    other_categories = [c for c in all_categories if c != category.display_name]
-    skip_list = ", ".join(other_categories)
+    skip_list = ", ".join(
+        c for c in _CATEGORY_DISPLAY_NAMES if c != category.display_name
+    )
+    display_lower = category.display_name.lower()
 
     prompt = f"""\
 Extract ALL {category.display_name} requirements from the tender document excerpts below.
@@ -120,11 +125,11 @@ CATEGORY DESCRIPTION: {category.description}
 {category.prompt_hints}
 
 INSTRUCTIONS:
-1. Extract EVERY {category.display_name.lower()} requirement, obligation, or condition found in the excerpts.
+1. Extract EVERY {display_lower} requirement, obligation, or condition found in the excerpts.
 2. For mandatory classification: "shall", "must", "required", "mandatory" = is_mandatory: true. "should", "may", "recommended", "desirable" = is_mandatory: false. For ambiguous language, default to mandatory (safer for tender compliance).
-3. ONLY extract {category.display_name.lower()} requirements. Skip requirements that belong to other categories ({skip_list}).
+3. ONLY extract {display_lower} requirements. Skip requirements that belong to other categories ({skip_list}).
 4. Do NOT fabricate or infer requirements not explicitly stated in the documents.
-5. If no {category.display_name.lower()} requirements are found, return an empty items list.
+5. If no {display_lower} requirements are found, return an empty items list.
 6. Be thorough -- missing a requirement could lead to tender disqualification.
 
 DOCUMENT EXCERPTS:
@@ -9,6 +9,7 @@ manages schema validation retries internally.
 from __future__ import annotations
 
 import logging
+import threading
 from typing import TypeVar
 
 import instructor
@@ -43,14 +44,21 @@ class GeminiService:
         self._api_key = api_key
         self._model = model
         self._client = None
+        # Guards lazy client creation -- extraction runs call extract() from
+        # several worker threads at once.
+        self._init_lock = threading.Lock()
 
     def _get_client(self) -> instructor.Instructor:
         """Lazily initialize the instructor-wrapped Gemini client."""
-        if self._client is None:
-            self._client = instructor.from_provider(
-                f"google/{self._model}",
-                api_key=self._api_key,
-            )
+        if self._client is not None:
+            return self._client
+
+        with self._init_lock:
+            if self._client is None:
+                self._client = instructor.from_provider(
+                    f"google/{self._model}",
+                    api_key=self._api_key,
+                )
         return self._client
 
     @retry(
@@ -83,20 +83,23 @@ class ParserInterface:
         raise NotImplementedError
 
 
-def get_parser_for_file(filename: str) -> ParserInterface:
-    """Return the appropriate parser instance for a given filename.
+# Module-level registry cache -- extension -> parser instance, built lazily.
+_parsers_by_extension: dict[str, ParserInterface] | None = None
 
-    Inspects the file extension and returns the first parser that supports it.
 
-    Args:
-        filename: Filename or path (only the extension is checked).
+def _get_parser_registry() -> dict[str, ParserInterface]:
+    """Build (once) and return the extension -> parser registry.
 
-    Returns:
-        A ParserInterface subclass instance capable of parsing the file.
+    Parsers are stateless, so a single instance of each is shared by all
+    calls. The first parser listed for an extension wins.
 
-    Raises:
-        ValueError: If no parser supports the file's extension.
+    Returns:
+        Dict mapping lowercase file extensions to parser instances.
     """
+    global _parsers_by_extension
+    if _parsers_by_extension is not None:
+        return _parsers_by_extension
+
     # Import here to avoid circular imports and allow lazy loading of heavy
     # dependencies (e.g. Docling models are ~2 GB on first download).
     from app.services.parsing.pdf_parser import PdfParser
@@ -109,14 +112,34 @@ def get_parser_for_file(filename: str) -> ParserInterface:
         XlsxParser(),
     ]
 
+    registry: dict[str, ParserInterface] = {}
     for parser in parsers:
-        if parser.can_parse(filename):
-            return parser
+        for ext in parser.supported_extensions:
+            registry.setdefault(ext, parser)
+    _parsers_by_extension = registry
+    return _parsers_by_extension
+
+
+def get_parser_for_file(filename: str) -> ParserInterface:
+    """Return the appropriate parser instance for a given filename.
+
+    Looks up the file extension in the shared parser registry.
+
+    Args:
+        filename: Filename or path (only the extension is checked).
+
+    Returns:
+        A ParserInterface subclass instance capable of parsing the file.
+
+    Raises:
+        ValueError: If no parser supports the file's extension.
+    """
+    registry = _get_parser_registry()
+    parser = registry.get(Path(filename).suffix.lower())
+    if parser is not None:
+        return parser
 
-    supported = []
-    for p in parsers:
-        supported.extend(p.supported_extensions)
     raise ValueError(
         f"No parser available for '{filename}'. "
-        f"Supported extensions: {', '.join(sorted(supported))}"
+        f"Supported extensions: {', '.join(sorted(registry))}"
     )
@@ -7,11 +7,15 @@ The converter is lazily initialized to avoid heavy imports at startup.
 """
 
 import asyncio
+import logging
 import time
+from collections import defaultdict
 from pathlib import Path
 
 from app.services.parsing.base import PageContent, ParsedDocument, ParserInterface
 
+logger = logging.getLogger(__name__)
+
 # Module-level converter cache -- lazy initialization.
 _converter = None
 
@@ -75,8 +79,8 @@ class DocxParser(ParserInterface):
             # ----------------------------------------------------------
             from docling_core.types.doc.labels import DocItemLabel
 
-            page_texts: dict[int, list[str]] = {}
-            page_tables: dict[int, list[dict]] = {}
+            page_texts: defaultdict[int, list[str]] = defaultdict(list)
+            page_tables: defaultdict[int, list[dict]] = defaultdict(list)
             all_tables: list[dict] = []
 
             for item, _level in doc.iterate_items():
@@ -92,7 +96,7 @@ class DocxParser(ParserInterface):
                 page_no = prov.page_no if prov else 1
 
                 if text:
-                    page_texts.setdefault(page_no, []).append(text)
+                    page_texts[page_no].append(text)
 
                 if label == DocItemLabel.TABLE:
                     try:
@@ -105,7 +109,7 @@ class DocxParser(ParserInterface):
                             "cols": len(df.columns),
                         }
                         all_tables.append(table_dict)
-                        page_tables.setdefault(page_no, []).append(table_dict)
+                        page_tables[page_no].append(table_dict)
                     except Exception as exc:
                         warnings.append(
                             f"Failed to export table on page {page_no}: {exc}"
@@ -156,7 +160,7 @@ class DocxParser(ParserInterface):
 
         except Exception as exc:
             processing_time_ms = int((time.perf_counter() - start_ms) * 1000)
-            print(f"[DocxParser] Error parsing {file_path}: {exc}")
+            logger.exception("Error parsing %s", file_path)
             return ParsedDocument(
                 filename=Path(file_path).name,
                 content_type="docx",
@@ -12,11 +12,15 @@ The Docling converter is lazily initialized because:
 """
 
 import asyncio
+import logging
 import time
+from collections import defaultdict
 from pathlib import Path
 
 from app.services.parsing.base import PageContent, ParsedDocument, ParserInterface
 
+logger = logging.getLogger(__name__)
+
 # Module-level converter cache -- lazy initialization.
 # NOTE: Adding Arabic to EasyOCR increases first-run model download size
 # by ~100 MB (Arabic recognition model). Subsequent runs use the cached model.
@@ -108,8 +112,8 @@ class PdfParser(ParserInterface):
             from docling_core.types.doc.labels import DocItemLabel
 
             # Accumulate text and tables per page number.
-            page_texts: dict[int, list[str]] = {}
-            page_tables: dict[int, list[dict]] = {}
+            page_texts: defaultdict[int, list[str]] = defaultdict(list)
+            page_tables: defaultdict[int, list[dict]] = defaultdict(list)
             all_tables: list[dict] = []
 
             for item, _level in doc.iterate_items():
@@ -124,7 +128,7 @@ class PdfParser(ParserInterface):
 
                 # Accumulate text for the page.
                 if text:
-                    page_texts.setdefault(page_no, []).append(text)
+                    page_texts[page_no].append(text)
 
                 # Extract tables with structure.
                 if label == DocItemLabel.TABLE:
@@ -138,7 +142,7 @@ class PdfParser(ParserInterface):
                             "cols": len(df.columns),
                         }
                         all_tables.append(table_dict)
-                        page_tables.setdefault(page_no, []).append(table_dict)
+                        page_tables[page_no].append(table_dict)
                     except Exception as exc:
                         warnings.append(
                             f"Failed to export table on page {page_no}: {exc}"
@@ -194,7 +198,7 @@ class PdfParser(ParserInterface):
             # error recorded in warnings so callers never get an unhandled
             # exception from the parsing layer.
             processing_time_ms = int((time.perf_counter() - start_ms) * 1000)
-            print(f"[PdfParser] Error parsing {file_path}: {exc}")
+            logger.exception("Error parsing %s", file_path)
             return ParsedDocument(
                 filename=Path(file_path).name,
                 content_type="pdf",
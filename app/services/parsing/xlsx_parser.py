@@ -10,6 +10,7 @@ computed cell values instead of formulas.
 """
 
 import asyncio
+import logging
 import time
 from pathlib import Path
 
@@ -17,12 +18,7 @@ from openpyxl import load_workbook
 
 from app.services.parsing.base import PageContent, ParsedDocument, ParserInterface
 
-
-def _cell_to_str(value) -> str:
-    """Convert any cell value to a string, handling None, dates, numbers."""
-    if value is None:
-        return ""
-    return str(value)
+logger = logging.getLogger(__name__)
 
 
 def _load_and_extract(file_path: str) -> dict:
@@ -46,11 +42,12 @@ def _load_and_extract(file_path: str) -> dict:
         rows: list[list[str]] = []
 
         for row in sheet.iter_rows(values_only=True):
-            # Skip completely empty rows (all cells None).
-            if not any(cell is not None for cell in row):
+            # Skip completely empty rows (all cells None). tuple.count runs
+            # in C, avoiding a generator frame per row.
+            if row.count(None) == len(row):
                 continue
-            row_values = [_cell_to_str(cell) for cell in row]
-            rows.append(row_values)
+            # Convert every cell to a string (None -> "", dates, numbers).
+            rows.append(["" if cell is None else str(cell) for cell in row])
 
         sheets_data.append({
             "sheet_name": sheet_name,
@@ -164,7 +161,7 @@ class XlsxParser(ParserInterface):
 
         except Exception as exc:
             processing_time_ms = int((time.perf_counter() - start_ms) * 1000)
-            print(f"[XlsxParser] Error parsing {file_path}: {exc}")
+            logger.exception("Error parsing %s", file_path)
             return ParsedDocument(
                 filename=Path(file_path).name,
                 content_type="xlsx",
@@ -3,6 +3,9 @@
 Provides a simple module-level dictionary to track per-task progress
 during document batch processing. Sufficient for single-user v1
 deployment. No external dependencies (Redis, etc.) needed.
+
+Each entry carries a "version" counter bumped on every change, so
+pollers (the SSE endpoint) can skip re-sending unchanged progress.
 """
 
 from __future__ import annotations
@@ -25,6 +28,7 @@ def init_progress(task_id: str, total: int) -> None:
         "current_file": "",
         "errors": [],
         "results": [],
+        "version": 0,
     }
 
 
@@ -37,8 +41,11 @@ def update_progress(task_id: str, processed: int, current_file: str) -> None:
         current_file: Name of the file currently being processed.
     """
     if task_id in progress_store:
-        progress_store[task_id]["processed"] = processed
-        progress_store[task_id]["current_file"] = current_file
+        entry = progress_store[task_id]
+        if entry["processed"] != processed or entry["current_file"] != current_file:
+            entry["processed"] = processed
+            entry["current_file"] = current_file
+            entry["version"] += 1
 
 
 def add_error(task_id: str, filename: str, error: str) -> None:
@@ -54,6 +61,7 @@ def add_error(task_id: str, filename: str, error: str) -> None:
             "filename": filename,
             "error": error,
         })
+        progress_store[task_id]["version"] += 1
 
 
 def add_result(task_id: str, filename: str, status: str, page_count: int | None) -> None:
@@ -71,6 +79,7 @@ def add_result(task_id: str, filename: str, status: str, page_count: int | None)
             "status": status,
             "page_count": page_count,
         })
+        progress_store[task_id]["version"] += 1
 
 
 def complete_progress(task_id: str) -> None:
@@ -81,6 +90,7 @@ def complete_progress(task_id: str) -> None:
     """
     if task_id in progress_store:
         progress_store[task_id]["status"] = "completed"
+        progress_store[task_id]["version"] += 1
 
 
 def fail_progress(task_id: str, reason: str) -> None:
@@ -93,6 +103,7 @@ def fail_progress(task_id: str, reason: str) -> None:
     if task_id in progress_store:
         progress_store[task_id]["status"] = "failed"
         progress_store[task_id]["error_reason"] = reason
+        progress_store[task_id]["version"] += 1
 
 
 def get_progress(task_id: str) -> dict | None:
@@ -15,12 +15,18 @@ Key design decisions:
 - Over-retrieval (top_k * 3) before fusion for better recall.
 - alpha=0.7 default weights semantic search higher (better for multilingual).
 - rrf_k=60 is the standard constant from the original RRF paper.
+- The semantic and keyword legs are independent, so hybrid mode runs the
+  vector query on a worker thread while BM25 scores on the caller's thread.
 """
 
 from __future__ import annotations
 
+import heapq
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import TYPE_CHECKING
 
 from app.services.search.keyword_search import KeywordSearchService
@@ -31,6 +37,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Worker threads for the semantic leg of hybrid search. Sized for a few
+# concurrent callers (API requests, extraction fan-out) without
+# oversubscribing the CPU-bound query embedding.
+_SEMANTIC_WORKERS = 4
+
 
 @dataclass
 class SearchResult:
@@ -85,6 +96,11 @@ class HybridSearchService:
         self._rrf_k = rrf_k
         self._keyword_service = KeywordSearchService()
         self._vector_service = VectorSearchService(embedding_service)
+        # Runs the semantic leg of hybrid searches concurrently with BM25.
+        self._executor = ThreadPoolExecutor(
+            max_workers=_SEMANTIC_WORKERS,
+            thread_name_prefix="hybrid-search",
+        )
 
     def search(
         self,
@@ -127,8 +143,9 @@ class HybridSearchService:
         self, project_id: int, query: str, top_k: int
     ) -> list[SearchResult]:
         """Run semantic-only search and return SearchResult list."""
+        # Results are built from metadata; skip fetching document text.
         raw_results = self._vector_service.search(
-            project_id, query, n_results=top_k
+            project_id, query, n_results=top_k, include_documents=False
         )
 
         results: list[SearchResult] = []
@@ -173,12 +190,19 @@ class HybridSearchService:
         # Over-retrieve for better fusion recall.
         over_retrieve = top_k * 3
 
-        semantic_results = self._vector_service.search(
-            project_id, query, n_results=over_retrieve
+        # Query embedding + ANN lookup and BM25 scoring don't depend on each
+        # other: overlap them so latency is the slower leg, not the sum.
+        semantic_future = self._executor.submit(
+            self._vector_service.search,
+            project_id,
+            query,
+            n_results=over_retrieve,
+            include_documents=False,
         )
         keyword_results = self._keyword_service.search(
             project_id, query, self._embedding_service, top_k=over_retrieve
         )
+        semantic_results = semantic_future.result()
 
         return self._rrf_fusion(semantic_results, keyword_results, top_k)
 
@@ -206,56 +230,31 @@ class HybridSearchService:
         Returns:
             List of SearchResult sorted by combined RRF score descending.
         """
-        alpha = self._alpha
         rrf_k = self._rrf_k
-
-        # Build rank maps (0-indexed ranks).
-        semantic_rank: dict[str, int] = {}
-        semantic_meta: dict[str, dict] = {}
-        for rank, (chunk_id, doc_text, metadata, distance) in enumerate(
-            semantic_results
-        ):
-            semantic_rank[chunk_id] = rank
-            semantic_meta[chunk_id] = metadata
-
-        keyword_rank: dict[str, int] = {}
-        keyword_meta: dict[str, dict] = {}
-        for rank, (chunk_id, score, doc_text, metadata) in enumerate(
-            keyword_results
-        ):
-            keyword_rank[chunk_id] = rank
-            keyword_meta[chunk_id] = metadata
-
-        # Collect all unique chunk IDs.
-        all_chunk_ids = set(semantic_rank.keys()) | set(keyword_rank.keys())
-
-        # Calculate RRF scores.
-        scored: list[tuple[str, float, dict]] = []
-        for chunk_id in all_chunk_ids:
-            rrf_score = 0.0
-
-            if chunk_id in semantic_rank:
-                rrf_score += alpha / (rrf_k + semantic_rank[chunk_id] + 1)
-
-            if chunk_id in keyword_rank:
-                rrf_score += (1 - alpha) / (rrf_k + keyword_rank[chunk_id] + 1)
-
+        semantic_weight = self._alpha
+        keyword_weight = 1 - self._alpha
+
+        # Accumulate RRF scores in one pass per list (ranks are 0-indexed).
+        rrf_scores: defaultdict[str, float] = defaultdict(float)
+        metadata_by_id: dict[str, dict] = {}
+        for rank, (chunk_id, _, metadata, _) in enumerate(semantic_results):
+            rrf_scores[chunk_id] += semantic_weight / (rrf_k + rank + 1)
+            metadata_by_id[chunk_id] = metadata
+
+        for rank, (chunk_id, _, _, metadata) in enumerate(keyword_results):
+            rrf_scores[chunk_id] += keyword_weight / (rrf_k + rank + 1)
             # Prefer semantic metadata (has original text), fall back to keyword.
-            metadata = semantic_meta.get(chunk_id) or keyword_meta.get(
-                chunk_id, {}
-            )
-            scored.append((chunk_id, rrf_score, metadata))
+            if not metadata_by_id.get(chunk_id):
+                metadata_by_id[chunk_id] = metadata
 
-        # Sort by RRF score descending and take top_k.
-        scored.sort(key=lambda x: x[1], reverse=True)
-        scored = scored[:top_k]
+        # Take top_k by RRF score descending.
+        top = heapq.nlargest(top_k, rrf_scores.items(), key=itemgetter(1))
 
-        # Build SearchResult objects.
-        results: list[SearchResult] = []
-        for chunk_id, rrf_score, metadata in scored:
-            results.append(
-                self._build_search_result(chunk_id, metadata, rrf_score)
-            )
+        build = self._build_search_result
+        results = [
+            build(chunk_id, metadata_by_id[chunk_id], rrf_score)
+            for chunk_id, rrf_score in top
+        ]
 
         logger.debug(
             "RRF fusion: %d semantic + %d keyword -> %d results",
@@ -8,26 +8,38 @@ to trigger after new documents are indexed.
 Key design decisions:
 - Tokenization uses normalize_for_search() + split() to match the
   normalization applied to indexed text (Pitfall 6 from RESEARCH).
+  Stored chunks are already normalized, so only queries are normalized
+  here.
 - Lazy index building: index is created on first search per project.
 - Cache invalidation: invalidate_index() must be called after new
   documents are added (Pitfall 4 from RESEARCH).
+- Thread safety: searches run on worker threads while indexing invalidates
+  from the event loop. Each project has a generation counter bumped on
+  invalidation; a build that started before an invalidation is still used
+  by the search that triggered it, but is not cached.
+- Single-flight builds: concurrent cold searches for one project wait on a
+  per-project lock, so the collection is fetched and indexed once.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
 from typing import TYPE_CHECKING
 
 import numpy as np
 from rank_bm25 import BM25Okapi
 
-from app.services.text_processing import normalize_for_search
+from app.services.text_processing import normalize_query
 
 if TYPE_CHECKING:
     from app.services.indexing.embedding_service import EmbeddingService
 
 logger = logging.getLogger(__name__)
 
+# Cached per-project index: (bm25, chunk_ids, documents, metadatas).
+_IndexEntry = tuple[BM25Okapi, list[str], list[str], list[dict]]
+
 
 class KeywordSearchService:
     """BM25 keyword search over project document chunks.
@@ -38,24 +50,34 @@ class KeywordSearchService:
     """
 
     def __init__(self) -> None:
-        # Cache: project_id -> (bm25, chunk_ids, documents, metadatas)
-        self._indices: dict[
-            int, tuple[BM25Okapi, list[str], list[str], list[dict]]
-        ] = {}
+        self._indices: dict[int, _IndexEntry] = {}
+        # project_id -> invalidation count; guarded by _lock with _indices.
+        self._generations: dict[int, int] = {}
+        self._lock = threading.Lock()
+        # project_id -> lock serializing index builds for that project.
+        self._build_locks: dict[int, threading.Lock] = {}
 
     def build_index(
         self, project_id: int, embedding_service: EmbeddingService
-    ) -> None:
+    ) -> _IndexEntry | None:
         """Build (or rebuild) the BM25 index for a project.
 
         Fetches ALL chunks from the project's ChromaDB collection and
         creates a BM25Okapi index from the normalized document texts.
+        The index is not cached if the project was invalidated while it was
+        being built, but it is still returned for the caller's search.
 
         Args:
             project_id: Database ID of the project.
             embedding_service: EmbeddingService to access the ChromaDB
                 collection.
+
+        Returns:
+            The built index entry, or None if there is nothing to index.
         """
+        with self._lock:
+            generation = self._generations.get(project_id, 0)
+
         try:
             collection = embedding_service.get_collection(project_id)
         except Exception as exc:
@@ -64,12 +86,12 @@ class KeywordSearchService:
                 project_id,
                 exc,
             )
-            return
+            return None
 
         count = collection.count()
         if count == 0:
             logger.debug("Empty collection for project %d, no BM25 index", project_id)
-            return
+            return None
 
         # Fetch all documents from ChromaDB.
         all_data = collection.get(include=["documents", "metadatas"])
@@ -80,34 +102,51 @@ class KeywordSearchService:
 
         if not documents:
             logger.debug("No documents in collection for project %d", project_id)
-            return
-
-        # Tokenize: normalize_for_search() then split on whitespace.
-        # Documents are already stored normalized in ChromaDB, but we
-        # re-normalize to be safe (idempotent operation).
-        tokenized_docs = [
-            normalize_for_search(doc).split() for doc in documents
-        ]
-
-        # Filter out empty tokenizations (would cause BM25 issues).
-        valid_indices = [i for i, tokens in enumerate(tokenized_docs) if tokens]
-        if not valid_indices:
+            return None
+
+        # Tokenize on whitespace. Documents are stored already passed through
+        # normalize_for_search() at chunking time, so re-normalizing here
+        # would only repeat work over the whole corpus.
+        tokenized_docs: list[list[str]] = []
+        valid_ids: list[str] = []
+        valid_docs: list[str] = []
+        valid_metas: list[dict] = []
+        for chunk_id, doc, meta in zip(chunk_ids, documents, metadatas):
+            tokens = doc.split()
+            # Skip empty tokenizations (would cause BM25 issues).
+            if tokens:
+                tokenized_docs.append(tokens)
+                valid_ids.append(chunk_id)
+                valid_docs.append(doc)
+                valid_metas.append(meta)
+
+        if not tokenized_docs:
             logger.debug("No tokenizable content for project %d", project_id)
-            return
+            return None
 
-        tokenized_docs = [tokenized_docs[i] for i in valid_indices]
-        chunk_ids = [chunk_ids[i] for i in valid_indices]
-        documents = [documents[i] for i in valid_indices]
-        metadatas = [metadatas[i] for i in valid_indices]
+        chunk_ids, documents, metadatas = valid_ids, valid_docs, valid_metas
 
-        bm25 = BM25Okapi(tokenized_docs)
+        entry: _IndexEntry = (
+            BM25Okapi(tokenized_docs),
+            chunk_ids,
+            documents,
+            metadatas,
+        )
 
-        self._indices[project_id] = (bm25, chunk_ids, documents, metadatas)
+        with self._lock:
+            if self._generations.get(project_id, 0) != generation:
+                logger.info(
+                    "Not caching BM25 index for project %d: invalidated during build",
+                    project_id,
+                )
+                return entry
+            self._indices[project_id] = entry
         logger.info(
             "Built BM25 index for project %d: %d chunks",
             project_id,
             len(chunk_ids),
         )
+        return entry
 
     def invalidate_index(self, project_id: int) -> None:
         """Remove the cached BM25 index for a project.
@@ -118,8 +157,10 @@ class KeywordSearchService:
         Args:
             project_id: Database ID of the project whose index to invalidate.
         """
-        if project_id in self._indices:
-            del self._indices[project_id]
+        with self._lock:
+            self._generations[project_id] = self._generations.get(project_id, 0) + 1
+            removed = self._indices.pop(project_id, None)
+        if removed is not None:
             logger.info("Invalidated BM25 index for project %d", project_id)
 
     def search(
@@ -147,34 +188,52 @@ class KeywordSearchService:
             tuples sorted by BM25 score descending. Only results with
             score > 0 are included.
         """
-        # Lazily build index if not cached.
-        if project_id not in self._indices:
-            self.build_index(project_id, embedding_service)
-
-        if project_id not in self._indices:
+        # Lazily build index if not cached. Read the entry once: another
+        # thread may invalidate it between lookups.
+        entry = self._indices.get(project_id)
+        if entry is None:
+            with self._lock:
+                build_lock = self._build_locks.setdefault(
+                    project_id, threading.Lock()
+                )
+            with build_lock:
+                # Another thread may have built it while we waited.
+                entry = self._indices.get(project_id)
+                if entry is None:
+                    entry = self.build_index(project_id, embedding_service)
+
+        if entry is None:
             # Index build failed or collection is empty.
             return []
 
-        bm25, chunk_ids, documents, metadatas = self._indices[project_id]
+        bm25, chunk_ids, documents, metadatas = entry
 
         # CRITICAL: tokenize query the same way as documents.
-        tokenized_query = normalize_for_search(query).split()
+        tokenized_query = normalize_query(query).split()
         if not tokenized_query:
             return []
 
         # Get BM25 scores for all documents.
         scores = bm25.get_scores(tokenized_query)
 
-        # Sort by score descending, take top_k where score > 0.
-        scored_indices = np.argsort(scores)[::-1]
+        # Select the top_k scores with a partial partition (O(n)) and sort
+        # only those, instead of fully sorting every document's score.
+        n_docs = len(scores)
+        k = min(top_k, n_docs)
+        if k <= 0:
+            return []
+        if k < n_docs:
+            top_indices = np.argpartition(scores, n_docs - k)[n_docs - k :]
+        else:
+            top_indices = np.arange(n_docs)
+        top_indices = top_indices[np.argsort(scores[top_indices])[::-1]]
 
+        # Keep results in score-descending order where score > 0.
         results: list[tuple[str, float, str, dict]] = []
-        for idx in scored_indices:
+        for idx in top_indices:
             score = float(scores[idx])
             if score <= 0:
                 break
-            if len(results) >= top_k:
-                break
             results.append(
                 (chunk_ids[idx], score, documents[idx], metadatas[idx])
             )
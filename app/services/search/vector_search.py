@@ -9,6 +9,10 @@ Key design decisions:
 - Query normalization matches index normalization (Pitfall 6 from RESEARCH).
 - Empty collections return empty results gracefully (no 500 errors).
 - Language filtering via ChromaDB ``where`` clause when specified.
+- Query vectors come from EmbeddingService.embed_query(), which caches them,
+  so repeated queries skip the embedding model.
+- Callers that only need metadata can skip fetching document text with
+  include_documents=False.
 """
 
 from __future__ import annotations
@@ -16,7 +20,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-from app.services.text_processing import normalize_for_search
+from app.services.text_processing import normalize_query
 
 if TYPE_CHECKING:
     from app.services.indexing.embedding_service import EmbeddingService
@@ -44,6 +48,7 @@ class VectorSearchService:
         query: str,
         n_results: int = 20,
         language_filter: str | None = None,
+        include_documents: bool = True,
     ) -> list[tuple[str, str, dict, float]]:
         """Search a project's ChromaDB collection by semantic similarity.
 
@@ -57,6 +62,9 @@ class VectorSearchService:
             n_results: Maximum number of results to return.
             language_filter: Optional language code ("ar", "en") to filter
                 results by detected language.
+            include_documents: Whether to fetch the stored (normalized)
+                document text. When False, the text slot of each result is
+                an empty string; original text is still in metadata["text"].
 
         Returns:
             List of (chunk_id, document_text, metadata_dict, distance_score)
@@ -64,7 +72,7 @@ class VectorSearchService:
             Returns empty list if collection is empty or doesn't exist.
         """
         # CRITICAL: normalize query the same way as indexed text (Pitfall 6).
-        normalized_query = normalize_for_search(query)
+        normalized_query = normalize_query(query)
 
         try:
             collection = self._embedding_service.get_collection(project_id)
@@ -77,7 +85,8 @@ class VectorSearchService:
             return []
 
         # Check if collection has any documents.
-        if collection.count() == 0:
+        count = collection.count()
+        if count == 0:
             logger.debug("Empty collection for project %d", project_id)
             return []
 
@@ -86,12 +95,19 @@ class VectorSearchService:
         if language_filter:
             where = {"language": language_filter}
 
+        include = ["metadatas", "distances"]
+        if include_documents:
+            include.append("documents")
+
         try:
+            query_embedding = self._embedding_service.embed_query(
+                normalized_query
+            )
             results = collection.query(
-                query_texts=[normalized_query],
-                n_results=min(n_results, collection.count()),
+                query_embeddings=[query_embedding],
+                n_results=min(n_results, count),
                 where=where,
-                include=["documents", "metadatas", "distances"],
+                include=include,
             )
         except Exception as exc:
             logger.error(
@@ -103,7 +119,10 @@ class VectorSearchService:
 
         # Unpack ChromaDB result format (lists of lists, one per query).
         ids = results.get("ids", [[]])[0]
-        documents = results.get("documents", [[]])[0]
+        if include_documents:
+            documents = results.get("documents", [[]])[0]
+        else:
+            documents = [""] * len(ids)
         metadatas = results.get("metadatas", [[]])[0]
         distances = results.get("distances", [[]])[0]
 
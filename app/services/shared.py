@@ -0,0 +1,90 @@
+"""Process-wide lazy singletons for the heavy shared services.
+
+Document indexing, search, extraction and checklist extraction all need the
+same embedding model, ChromaDB client, BM25 cache and NLI model. Building
+them once per process keeps a single copy of each model in memory and lets
+indexing invalidate the same BM25 cache that search reads from.
+
+Key design decisions:
+- Lazy initialization: nothing is imported or loaded until first use, so
+  app startup stays fast (same pattern as the per-module singletons before).
+- Heavy modules are imported inside the getters for the same reason.
+- Singletons are only created from the event loop thread, so no locking.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from app.config import get_settings
+
+if TYPE_CHECKING:
+    from app.services.extraction.citation_verifier import CitationVerifier
+    from app.services.indexing.embedding_service import EmbeddingService
+    from app.services.llm.gemini_service import GeminiService
+    from app.services.search.hybrid_search import HybridSearchService
+
+_embedding_service: EmbeddingService | None = None
+_search_service: HybridSearchService | None = None
+_citation_verifier: CitationVerifier | None = None
+_llm_service: GeminiService | None = None
+
+
+def get_embedding_service() -> EmbeddingService:
+    """Get or create the shared EmbeddingService singleton."""
+    global _embedding_service
+    if _embedding_service is None:
+        from app.services.indexing.embedding_service import EmbeddingService
+
+        settings = get_settings()
+        _embedding_service = EmbeddingService(
+            persist_dir=settings.chroma_persist_dir,
+            model_name=settings.embedding_model,
+            query_cache_size=settings.query_embedding_cache_size,
+        )
+    return _embedding_service
+
+
+def get_search_service() -> HybridSearchService:
+    """Get or create the shared HybridSearchService singleton."""
+    global _search_service
+    if _search_service is None:
+        from app.services.search.hybrid_search import HybridSearchService
+
+        _search_service = HybridSearchService(
+            embedding_service=get_embedding_service()
+        )
+    return _search_service
+
+
+def get_citation_verifier() -> CitationVerifier:
+    """Get or create the shared CitationVerifier singleton."""
+    global _citation_verifier
+    if _citation_verifier is None:
+        from app.services.extraction.citation_verifier import CitationVerifier
+
+        settings = get_settings()
+        _citation_verifier = CitationVerifier(
+            model_name=settings.nli_model,
+            confidence_high=settings.confidence_high_threshold,
+            confidence_low=settings.confidence_low_threshold,
+            review_threshold=settings.review_threshold,
+        )
+    return _citation_verifier
+
+
+def get_llm_service() -> GeminiService:
+    """Get or create the shared GeminiService singleton.
+
+    Callers must check that ``gemini_api_key`` is configured first.
+    """
+    global _llm_service
+    if _llm_service is None:
+        from app.services.llm.gemini_service import GeminiService
+
+        settings = get_settings()
+        _llm_service = GeminiService(
+            api_key=settings.gemini_api_key,
+            model=settings.gemini_model,
+        )
+    return _llm_service
@@ -8,6 +8,7 @@ Usage:
     from app.services.text_processing import (
         normalize_arabic,
         normalize_for_search,
+        normalize_query,
         detect_language,
         detect_languages_per_section,
         clean_ocr_text,
@@ -17,6 +18,7 @@ Usage:
 from app.services.text_processing.arabic_normalizer import (
     normalize_arabic,
     normalize_for_search,
+    normalize_query,
 )
 from app.services.text_processing.language_detector import (
     detect_language,
@@ -27,6 +29,7 @@ from app.services.text_processing.text_cleaner import clean_ocr_text
 __all__ = [
     "normalize_arabic",
     "normalize_for_search",
+    "normalize_query",
     "detect_language",
     "detect_languages_per_section",
     "clean_ocr_text",
@@ -15,9 +15,15 @@ Normalization steps (applied in order):
 IMPORTANT: normalize_for_search() MUST be applied at both index time and query
 time to ensure consistent matching. Using it at only one stage will cause
 mismatches between indexed text and search queries.
+
+normalize_query() is a memoized wrapper around normalize_for_search() for
+short query strings, which repeat heavily (hybrid search normalizes each
+query in both legs, and extraction reuses a fixed set of queries). Document
+text is not cached since it is large and rarely repeats.
 """
 
 import re
+from functools import lru_cache
 
 # Try to use PyArabic for more reliable diacritics removal.
 # Falls back to regex if PyArabic is unavailable.
@@ -134,3 +140,19 @@ def normalize_for_search(text: str) -> str:
         'scope of work نطاق العمل'
     """
     return normalize_arabic(text).lower()
+
+
+@lru_cache(maxsize=1024)
+def normalize_query(query: str) -> str:
+    """Normalize a search query, caching results for repeated queries.
+
+    Equivalent to normalize_for_search() but memoized; intended for short
+    query strings only, not document text.
+
+    Args:
+        query: Raw search query.
+
+    Returns:
+        Normalized, lowercased query text.
+    """
+    return normalize_for_search(query)
@@ -63,6 +63,14 @@ _NUMBER_FORMAT_PATTERN = re.compile(
 # Arabic text, then number, then Arabic text -- check for reversed digits.
 _ARABIC_CHAR_RANGE = re.compile(r"[\u0600-\u06FF]")
 
+# Latin letters, used to detect mixed RTL/LTR lines.
+_LATIN_CHAR_PATTERN = re.compile(r"[a-zA-Z]")
+
+# Digits immediately adjacent to Arabic characters without a separator.
+_DIGIT_ARABIC_ADJACENT_PATTERN = re.compile(
+    r"\d[\u0600-\u06FF]|[\u0600-\u06FF]\d"
+)
+
 
 def clean_ocr_text(text: str) -> str:
     """Clean post-OCR text output for Arabic and mixed content.
@@ -202,7 +210,7 @@ def _has_mixed_bidi_content(text: str) -> bool:
         True if both Arabic and Latin characters are present.
     """
     has_arabic = bool(_ARABIC_CHAR_RANGE.search(text))
-    has_latin = bool(re.search(r"[a-zA-Z]", text))
+    has_latin = bool(_LATIN_CHAR_PATTERN.search(text))
     return has_arabic and has_latin
 
 
@@ -278,8 +286,4 @@ def _has_suspicious_number_ordering(text: str) -> bool:
     # Look for digit sequences immediately adjacent to Arabic characters
     # without expected separators (space, comma, period, parenthesis).
     # This pattern catches cases like "123مرحبا" which should be "مرحبا 123".
-    suspicious = re.search(
-        r"\d[\u0600-\u06FF]|[\u0600-\u06FF]\d",
-        text,
-    )
-    return bool(suspicious)
+    return bool(_DIGIT_ARABIC_ADJACENT_PATTERN.search(text))
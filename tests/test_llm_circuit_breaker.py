@@ -0,0 +1,105 @@
+"""Tests for the per-run LLM circuit breaker in extraction and checklist runs."""
+
+import asyncio
+import threading
+
+from app.services.extraction.checklist_definitions import CHECKLIST_CATEGORIES
+from app.services.extraction.checklist_service import ChecklistService
+from app.services.extraction.extraction_service import ExtractionService
+from app.services.extraction.field_definitions import SUMMARY_FIELDS
+from app.services.llm.circuit_breaker import LLMCircuitBreaker
+from app.services.search.hybrid_search import SearchResult
+
+MAX_CONCURRENCY = 4
+MAX_CONSECUTIVE_FAILURES = 5
+
+
+class _FakeSearchService:
+    """Returns one chunk for every query."""
+
+    def search(self, project_id, query, top_k, mode):
+        return [
+            SearchResult(
+                chunk_id="1_p1_c0",
+                text="The bid bond is 2% of the tender value.",
+                score=0.9,
+                document_id=1,
+                page_number=1,
+                language="en",
+                filename="spec.pdf",
+                chunk_type="text",
+                section_name=None,
+            )
+        ]
+
+
+class _FailingLLMService:
+    """Counts calls and always fails, like an unreachable provider.
+
+    The first ``MAX_CONCURRENCY`` calls wait for each other so they are all
+    in flight at once, as they are when the provider hangs before failing.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._barrier = threading.Barrier(MAX_CONCURRENCY, timeout=5)
+
+    def extract(self, prompt, response_model):
+        with self._lock:
+            self.calls += 1
+            call_number = self.calls
+        if call_number <= MAX_CONCURRENCY:
+            self._barrier.wait()
+        raise ConnectionError("provider unavailable")
+
+
+def test_breaker_trips_after_consecutive_failures():
+    async def run() -> list[bool]:
+        breaker = LLMCircuitBreaker(max_consecutive_failures=3)
+        allowed = []
+        for outcome in ("fail", "fail", "ok", "fail", "fail", "fail", "skip"):
+            allowed.append(await breaker.allow_call())
+            if outcome == "ok":
+                await breaker.record_success()
+            elif outcome == "fail":
+                await breaker.record_failure()
+        return allowed
+
+    assert asyncio.run(run()) == [True] * 6 + [False]
+
+
+def test_extraction_skips_llm_calls_once_tripped():
+    llm = _FailingLLMService()
+    service = ExtractionService(
+        search_service=_FakeSearchService(),
+        llm_service=llm,
+        citation_verifier=None,
+        max_concurrency=MAX_CONCURRENCY,
+        max_consecutive_failures=MAX_CONSECUTIVE_FAILURES,
+    )
+
+    summary = asyncio.run(service.extract_project_summary(project_id=1))
+
+    assert llm.calls == MAX_CONSECUTIVE_FAILURES
+    assert llm.calls < len(SUMMARY_FIELDS)
+    assert all(
+        getattr(summary, field_def.name).value is None for field_def in SUMMARY_FIELDS
+    )
+
+
+def test_checklist_skips_llm_calls_once_tripped():
+    llm = _FailingLLMService()
+    service = ChecklistService(
+        search_service=_FakeSearchService(),
+        llm_service=llm,
+        citation_verifier=None,
+        max_concurrency=MAX_CONCURRENCY,
+        max_consecutive_failures=MAX_CONSECUTIVE_FAILURES,
+    )
+
+    checklist = asyncio.run(service.extract_checklist(project_id=1))
+
+    assert llm.calls == MAX_CONSECUTIVE_FAILURES
+    assert llm.calls < len(CHECKLIST_CATEGORIES)
+    assert checklist.total_count == 0